@@ -4,12 +4,18 @@ Code Agent - A multi-agent system that automates software development workflows.
 
 __version__ = '0.1.0'
 
-from .main import CodeAgentApp, create_app
-
 # Add UI-related imports and functions
 def launch_ui_app(**kwargs):
     """Launch the Code Agent UI application"""
     from .ui import launch_ui
     launch_ui(**kwargs)
 
-__all__ = ['CodeAgentApp', 'create_app', 'launch_ui_app']
\ No newline at end of file
+def __getattr__(name):
+    # Importing .main pulls in every agent and smolagents, so defer it until
+    # the app is actually requested
+    if name in {"CodeAgentApp", "create_app"}:
+        from . import main
+        return getattr(main, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['CodeAgentApp', 'create_app', 'launch_ui_app']
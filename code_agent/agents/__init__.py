@@ -2,18 +2,25 @@
 Specialized agents for the Code Agent application.
 """
 
-from .base import BaseSpecializedAgent
-from .architect import ArchitectAgent
-from .developer import DeveloperAgent
-from .tester import TesterAgent
-from .reviewer import ReviewerAgent
-from .orchestrator import AgentOrchestrator
+import importlib
 
-__all__ = [
-    'BaseSpecializedAgent',
-    'ArchitectAgent',
-    'DeveloperAgent',
-    'TesterAgent',
-    'ReviewerAgent',
-    'AgentOrchestrator'
-] 
+# Exported name -> submodule defining it, imported on first access
+_EXPORTS = {
+    'BaseSpecializedAgent': '.base',
+    'AgentPool': '.base',
+    'gather_agent_calls': '.base',
+    'ArchitectAgent': '.architect',
+    'DeveloperAgent': '.developer',
+    'TesterAgent': '.tester',
+    'ReviewerAgent': '.reviewer',
+    'AgentOrchestrator': '.orchestrator',
+}
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = list(_EXPORTS)
@@ -1,21 +1,97 @@
-from typing import List, Dict, Any, Optional
-from smolagents import HfApiModel
+import functools
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
-from .base import BaseSpecializedAgent
+from .base import BASE_AUTHORIZED_IMPORTS, BaseSpecializedAgent
+from ..utils.response_cache import ResponseCache
+from ..utils.template_cache import TemplateCache
+
+if TYPE_CHECKING:
+    from smolagents import HfApiModel
+
+# Static instructions come first and the per-call data last, so repeated
+# calls share the longest possible prompt prefix with the provider's cache
+_ANALYZE_REQUIREMENTS_PREFIX = """
+You are a senior system architect. Please analyze the project requirements given below
+and break them down into:
+
+1. Core features (as a list of distinct features)
+2. Component architecture (how the system should be structured)
+3. Data structures (what data models are needed)
+4. API endpoints (if applicable)
+5. External dependencies (what libraries or services are needed)
+6. Potential technical challenges
+
+For each feature identified, provide:
+- A clear name
+- A brief description
+- Priority (high/medium/low)
+- Technical complexity (high/medium/low)
+
+Be thorough in your analysis, as this will guide the entire development process.
+Think step by step.
+"""
+
+_ANALYZE_REQUIREMENTS_TEMPLATE = _ANALYZE_REQUIREMENTS_PREFIX + """
+REQUIREMENTS:
+{requirements}
+"""
+
+_DESIGN_STRUCTURE_PREFIX = """
+You are a senior system architect. Based on the project requirements and features given below,
+design an optimal directory structure for a Python project.
+
+Please:
+1. Create a complete directory structure with all necessary files
+2. For each directory, explain its purpose
+3. For key files, explain what they should contain
+4. Create the base structure using the filesystem tools provided (create_directory, write_file)
+5. Create essential files like README.md, setup.py, etc.
+
+IMPORTANT: Use the filesystem tools (create_directory, write_file) provided to you instead of direct os module calls.
+These tools will automatically handle the correct base path and ensure files are created in the right location.
+
+Make sure to follow Python best practices for project organization.
+The structure should be clean, maintainable, and scalable.
+
+After designing the structure, implement it by creating the actual directories and files.
+"""
+
+_DESIGN_STRUCTURE_TEMPLATE = _DESIGN_STRUCTURE_PREFIX + """
+REQUIREMENTS:
+{requirements}
+
+FEATURES:
+{features}
+"""
+
+@functools.lru_cache(maxsize=32)
+def _format_features(features: tuple) -> str:
+    """Format (name, description, priority, complexity) tuples as a prompt list"""
+    return "\n".join(
+        f"- {name}: {description} (Priority: {priority}, Complexity: {complexity})"
+        for name, description, priority, complexity in features
+    )
+
+_IMPORTS = BASE_AUTHORIZED_IMPORTS + ("sys", "re")
 
 class ArchitectAgent(BaseSpecializedAgent):
     """Agent specialized in system architecture design"""
     
-    def __init__(self, model: HfApiModel, tools: List[Any]):
+    max_steps = 15
+    
+    def __init__(self, model: "HfApiModel", tools: List[Any], cache: Optional[ResponseCache] = None,
+                 template_cache: Optional[TemplateCache] = None):
         """
         Initialize architect agent
         
         Args:
             model: HfApiModel instance
             tools: List of tools
+            cache: Response cache (optional)
+            template_cache: Cache of analyses reused across similar projects (optional)
         """
-        imports = ["os", "pathlib", "json", "sys", "re"]
-        super().__init__("architect", model, tools, imports)
+        super().__init__("architect", model, tools, _IMPORTS, cache)
+        self.template_cache = template_cache
     
     def get_description(self) -> str:
         """Return the agent description"""
@@ -35,31 +111,21 @@ class ArchitectAgent(BaseSpecializedAgent):
         Returns:
             Analysis results
         """
-        prompt = f"""
-        You are a senior system architect. Please analyze the following project requirements 
-        and break them down into:
+        # Reuse the analysis of a project with the same shape if there is one
+        if self.template_cache is not None:
+            cached = self.template_cache.get(requirements)
+            if cached is not None:
+                return cached
         
-        1. Core features (as a list of distinct features)
-        2. Component architecture (how the system should be structured)
-        3. Data structures (what data models are needed)
-        4. API endpoints (if applicable)
-        5. External dependencies (what libraries or services are needed)
-        6. Potential technical challenges
+        prompt = _ANALYZE_REQUIREMENTS_TEMPLATE.format_map({"requirements": requirements})
         
-        REQUIREMENTS:
-        {requirements}
+        # The analysis only reads the requirements, so it may come from the response cache
+        response = self.run(prompt, cacheable=True)
         
-        For each feature identified, provide:
-        - A clear name
-        - A brief description
-        - Priority (high/medium/low)
-        - Technical complexity (high/medium/low)
+        if self.template_cache is not None and response is not None:
+            self.template_cache.put(requirements, response)
         
-        Be thorough in your analysis, as this will guide the entire development process.
-        Think step by step.
-        """
-        
-        return self.run(prompt)
+        return response
     
     def design_project_structure(self, requirements: str, features: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -72,35 +138,13 @@ class ArchitectAgent(BaseSpecializedAgent):
         Returns:
             Directory structure design
         """
-        features_str = "\n".join([
-            f"- {f['name']}: {f['description']} (Priority: {f['priority']}, Complexity: {f['complexity']})"
-            for f in features
-        ])
-        
-        prompt = f"""
-        You are a senior system architect. Based on the following project requirements and features,
-        design an optimal directory structure for a Python project.
-        
-        REQUIREMENTS:
-        {requirements}
-        
-        FEATURES:
-        {features_str}
-        
-        Please:
-        1. Create a complete directory structure with all necessary files
-        2. For each directory, explain its purpose
-        3. For key files, explain what they should contain
-        4. Create the base structure using the filesystem tools provided (create_directory, write_file)
-        5. Create essential files like README.md, setup.py, etc.
-        
-        IMPORTANT: Use the filesystem tools (create_directory, write_file) provided to you instead of direct os module calls.
-        These tools will automatically handle the correct base path and ensure files are created in the right location.
-        
-        Make sure to follow Python best practices for project organization.
-        The structure should be clean, maintainable, and scalable.
-        
-        After designing the structure, implement it by creating the actual directories and files.
-        """
+        features_str = _format_features(tuple(
+            (f['name'], f['description'], f['priority'], f['complexity']) for f in features
+        ))
+        
+        prompt = _DESIGN_STRUCTURE_TEMPLATE.format_map({
+            "requirements": requirements,
+            "features": features_str
+        })
         
         return self.run(prompt) 
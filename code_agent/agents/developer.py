@@ -1,21 +1,75 @@
-from typing import List, Dict, Any, Optional
-from smolagents import HfApiModel
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
-from .base import BaseSpecializedAgent
+from .base import BASE_AUTHORIZED_IMPORTS, BaseSpecializedAgent, compact_json
+from ..utils.response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    from smolagents import HfApiModel
+
+_IMPLEMENT_FEATURE_PREFIX = """
+You are a senior software developer. Implement the feature described below for our project,
+using the project architecture and structure given before it.
+
+Please:
+1. Determine which files need to be created or modified
+2. Implement the feature with high-quality code
+3. Ensure proper error handling
+4. Add comprehensive docstrings and comments
+5. Follow PEP 8 style guidelines
+6. Make your code testable
+
+For each file you create or modify:
+1. First check if it exists using file_exists or directory_exists
+2. If it exists and you need to modify it, read it first
+3. Create/update the file with your implementation
+
+IMPORTANT:
+- All code must be syntactically valid Python
+- Use proper indentation and formatting
+- Include all necessary imports
+- Handle all edge cases and potential errors
+- Add type hints where appropriate
+
+Return a dictionary with:
+1. "files": List of files created/modified
+2. "code": The complete implementation code
+3. "summary": A summary of what was implemented
+"""
+
+# Shared by every feature of a project, so it goes before the feature details
+_PROJECT_CONTEXT_TEMPLATE = """
+PROJECT ARCHITECTURE:
+{architecture}
+
+PROJECT STRUCTURE:
+{project_structure}
+"""
+
+_FEATURE_TEMPLATE = """
+FEATURE:
+Name: {name}
+Description: {description}
+Priority: {priority}
+Complexity: {complexity}
+"""
+
+_IMPORTS = BASE_AUTHORIZED_IMPORTS + ("sys", "re", "datetime", "typing")
 
 class DeveloperAgent(BaseSpecializedAgent):
     """Agent specialized in code implementation"""
     
-    def __init__(self, model: HfApiModel, tools: List[Any]):
+    max_steps = 20
+    
+    def __init__(self, model: "HfApiModel", tools: List[Any], cache: Optional[ResponseCache] = None):
         """
         Initialize developer agent
         
         Args:
             model: HfApiModel instance
             tools: List of tools
+            cache: Response cache (optional)
         """
-        imports = ["os", "pathlib", "json", "sys", "re", "datetime", "typing"]
-        super().__init__("developer", model, tools, imports)
+        super().__init__("developer", model, tools, _IMPORTS, cache)
     
     def get_description(self) -> str:
         """Return the agent description"""
@@ -42,45 +96,60 @@ class DeveloperAgent(BaseSpecializedAgent):
         Returns:
             Implementation result
         """
-        prompt = f"""
-        You are a senior software developer. Implement the following feature for our project:
-        
-        FEATURE:
-        Name: {feature['name']}
-        Description: {feature['description']}
-        Priority: {feature['priority']}
-        Complexity: {feature['complexity']}
-        
-        PROJECT ARCHITECTURE:
-        {architecture}
+        prompt = self._implement_feature_prompt(feature, architecture, project_structure)
         
-        PROJECT STRUCTURE:
-        {project_structure}
-        
-        Please:
-        1. Determine which files need to be created or modified
-        2. Implement the feature with high-quality code
-        3. Ensure proper error handling
-        4. Add comprehensive docstrings and comments
-        5. Follow PEP 8 style guidelines
-        6. Make your code testable
+        return self.run(prompt)
+    
+    def implement_features_batch(
+        self,
+        features: List[Dict[str, Any]],
+        architecture: Dict[str, Any],
+        project_structure: Dict[str, Any],
+        return_exceptions: bool = True
+    ) -> List[Any]:
+        """
+        Implement several independent features concurrently
         
-        For each file you create or modify:
-        1. First check if it exists using file_exists or directory_exists
-        2. If it exists and you need to modify it, read it first
-        3. Create/update the file with your implementation
+        Args:
+            features: List of feature details
+            architecture: Architecture information
+            project_structure: Project structure information
+            return_exceptions: Return a failed feature's exception in place of its result
+            
+        Returns:
+            Implementation results in the same order as the features
+        """
+        prompts = [
+            self._implement_feature_prompt(feature, architecture, project_structure)
+            for feature in features
+        ]
         
-        IMPORTANT:
-        - All code must be syntactically valid Python
-        - Use proper indentation and formatting
-        - Include all necessary imports
-        - Handle all edge cases and potential errors
-        - Add type hints where appropriate
+        return self.run_batch(prompts, return_exceptions=return_exceptions)
+    
+    def _implement_feature_prompt(
+        self,
+        feature: Dict[str, Any],
+        architecture: Dict[str, Any],
+        project_structure: Dict[str, Any]
+    ) -> str:
+        """Build the implementation prompt for a feature"""
+        feature_block = _FEATURE_TEMPLATE.format_map({
+            "name": feature['name'],
+            "description": feature['description'],
+            "priority": feature['priority'],
+            "complexity": feature['complexity']
+        })
         
-        Return a dictionary with:
-        1. "files": List of files created/modified
-        2. "code": The complete implementation code
-        3. "summary": A summary of what was implemented
+        return _IMPLEMENT_FEATURE_PREFIX + self._project_context(architecture, project_structure) + feature_block
+    
+    def _project_context(self, architecture: Dict[str, Any], project_structure: Dict[str, Any]) -> str:
         """
+        Render the project context block
         
-        return self.run(prompt) 
+        compact_json is deterministic, so every feature of a project gets a
+        byte-identical block and the prompts share a prefix with the provider's cache.
+        """
+        return _PROJECT_CONTEXT_TEMPLATE.format_map({
+            "architecture": compact_json(architecture),
+            "project_structure": compact_json(project_structure)
+        })
@@ -1,21 +1,52 @@
-from typing import List, Dict, Any, Optional
-from smolagents import HfApiModel
+import hashlib
+import os
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
-from .base import BaseSpecializedAgent
+from .base import BASE_AUTHORIZED_IMPORTS, BaseSpecializedAgent
+from ..utils.response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    from smolagents import HfApiModel
+
+_SETUP_ENVIRONMENT_PREFIX = """
+You are a DevOps engineer specializing in Python environments. You need to set up a
+Python environment for the project whose directory is given below.
+
+Follow these steps:
+
+1. Determine if requirements.txt exists in the project directory
+2. If it doesn't exist, create a requirements.txt file based on imports in the code
+3. Set up a virtual environment for the project
+4. Install dependencies from the requirements.txt file
+5. Verify the installation was successful
+
+Return a detailed report of the environment setup process.
+"""
+
+_SETUP_ENVIRONMENT_TEMPLATE = _SETUP_ENVIRONMENT_PREFIX + """
+PROJECT DIRECTORY: {project_dir}
+"""
+
+_IMPORTS = BASE_AUTHORIZED_IMPORTS + ("sys", "subprocess", "venv")
 
 class EnvironmentSetupAgent(BaseSpecializedAgent):
     """Agent specialized in environment and dependency setup"""
     
-    def __init__(self, model: HfApiModel, tools: List[Any]):
+    max_steps = 5
+    
+    def __init__(self, model: "HfApiModel", tools: List[Any], cache: Optional[ResponseCache] = None):
         """
         Initialize environment setup agent
         
         Args:
             model: HfApiModel instance
             tools: List of tools
+            cache: Response cache (optional)
         """
-        imports = ["os", "pathlib", "json", "sys", "subprocess", "venv"]
-        super().__init__("environment_setup", model, tools, imports)
+        super().__init__("environment_setup", model, tools, _IMPORTS, cache)
+        
+        # Setup results keyed by (project_dir, sha256 of requirements.txt)
+        self._env_state: Dict[Tuple[str, str], Any] = {}
     
     def get_description(self) -> str:
         """Return the agent description"""
@@ -36,21 +67,36 @@ class EnvironmentSetupAgent(BaseSpecializedAgent):
         Returns:
             Environment setup results
         """
-        prompt = f"""
-        You are a DevOps engineer specializing in Python environments. You need to set up a 
-        Python environment for the following project:
+        if requirements_path is None:
+            requirements_path = os.path.join(project_dir, "requirements.txt")
         
-        PROJECT DIRECTORY: {project_dir}
+        # Skip the setup if the environment was already built from these requirements
+        state_key = self._environment_key(project_dir, requirements_path)
+        if state_key in self._env_state and self._has_venv(project_dir):
+            return self._env_state[state_key]
         
-        Follow these steps:
+        prompt = _SETUP_ENVIRONMENT_TEMPLATE.format_map({"project_dir": project_dir})
         
-        1. Determine if requirements.txt exists in the project directory
-        2. If it doesn't exist, create a requirements.txt file based on imports in the code
-        3. Set up a virtual environment for the project
-        4. Install dependencies from the requirements.txt file
-        5. Verify the installation was successful
+        result = self.run(prompt)
         
-        Return a detailed report of the environment setup process.
-        """
+        # The agent may have written requirements.txt, so key on its final contents
+        state_key = self._environment_key(project_dir, requirements_path)
+        if state_key is not None and self._has_venv(project_dir):
+            self._env_state[state_key] = result
         
-        return self.run(prompt)
\ No newline at end of file
+        return result
+    
+    @staticmethod
+    def _environment_key(project_dir: str, requirements_path: str) -> Optional[Tuple[str, str]]:
+        """Key an environment by project and requirements contents, or None if there are no requirements"""
+        try:
+            with open(requirements_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+        return os.path.abspath(project_dir), digest
+    
+    @staticmethod
+    def _has_venv(project_dir: str) -> bool:
+        """Check whether the project's virtual environment exists"""
+        return os.path.isfile(os.path.join(project_dir, ".venv", "pyvenv.cfg"))
\ No newline at end of file
@@ -1,10 +1,399 @@
+import asyncio
+import functools
+import hashlib
+import importlib
+import json
 import os
-from smolagents import CodeAgent, HfApiModel
-from typing import List, Dict, Any, Optional, Union
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, Union, TYPE_CHECKING
 
-from ..config import Config
-from ..tools import github_tools, filesystem_tools, code_tools, test_tools
+from .base import (
+    BASE_AUTHORIZED_IMPORTS, AgentPool, CircuitBreaker, _get_agent_executor, parse_json_response, run_blocking
+)
+from ..config import AgentConfig, Config
 from ..utils.logger import logger
+from ..utils.response_cache import ResponseCache
+
+# smolagents and the tool modules are heavy to import, so they load on first use
+if TYPE_CHECKING:
+    from smolagents import CodeAgent
+
+# Default number of feature pipelines run concurrently by build_application
+DEFAULT_MAX_PARALLEL_FEATURES = 4
+
+# Agent results remembered per orchestrator, by agent and prompt
+RUN_CACHE_SIZE = 32
+
+# Agents whose runs only read the project; the others write files, so a
+# repeated run has to happen again rather than return the earlier result
+_CACHEABLE_AGENTS = frozenset({"architect", "reviewer"})
+
+_MISSING = object()
+
+# Response cache namespace of requirements analyses, memoized across runs
+# when config.enable_response_cache is set
+ANALYSIS_CACHE_NAMESPACE = "analysis"
+
+# Shared opening of every orchestrator prompt. Each template is this prefix,
+# then its fixed instructions, then a separator and the per-call inputs, most
+# stable first, so repeated calls share the longest possible cached prefix.
+_SYSTEM_PREFIX = """
+You are part of a team of agents building a Python application together. Work only inside the
+project directory, using the tools provided to you, and keep your answer to what is asked.
+When you create or read several files in one step, call write_files with a dict of path to
+content, or read_files with a list of paths, instead of calling write_file or read_file per file.
+"""
+
+_SEPARATOR = "\n---\n"
+
+# Stands in for the test results when the review runs alongside testing
+_TEST_RESULTS_PENDING = "Tests are running concurrently; review the implementation on its own."
+
+# Per-call inputs shared by the developer templates
+_FEATURE_INPUTS = """
+ARCHITECTURE:
+{architecture_info}
+
+FEATURE:
+Name: {feature_name}
+Description: {feature_description}
+"""
+
+_ANALYZE_REQUIREMENTS_TEMPLATE = _SYSTEM_PREFIX + """
+You are a senior system architect. Analyze the project requirements given below and break
+them down into a component architecture and a list of distinct, independently implementable features.
+
+Rate each feature's complexity as SIMPLE (a few lines in one file), MODERATE or COMPLEX.
+
+Respond ONLY with a JSON object of the form:
+{{"architecture": "<description of the components and how they fit together>",
+  "features": [{{"name": "<feature name>", "description": "<what the feature does>",
+                 "complexity": "SIMPLE|MODERATE|COMPLEX"}}]}}
+""" + _SEPARATOR + """
+REQUIREMENTS:
+{requirements}
+"""
+
+_IMPLEMENT_FEATURE_TEMPLATE = _SYSTEM_PREFIX + """
+You are a senior software developer. Implement the feature described below for our project.
+
+Use the filesystem tools to create or modify the files the feature needs. Write syntactically
+valid Python with docstrings, type hints, error handling and all necessary imports.
+
+Return a dictionary with:
+1. "files": List of files created/modified
+2. "summary": A summary of what was implemented
+""" + _SEPARATOR + _FEATURE_INPUTS
+
+_IMPLEMENT_SIMPLE_FEATURE_TEMPLATE = _SYSTEM_PREFIX + """
+You are a senior software developer. The feature described below is small, so implement it,
+test it and review it yourself in one pass.
+
+Use the filesystem tools to write the implementation and a pytest test file for it, run the
+tests, then check your own code for bugs, documentation and style.
+
+Respond ONLY with a JSON object with the keys:
+1. "files": List of files created/modified
+2. "tests": Test files created and their results
+3. "review": Issues found and fixed during your self-review
+""" + _SEPARATOR + _FEATURE_INPUTS
+
+_CLASSIFY_FEATURE_TEMPLATE = """
+Classify the complexity of implementing the software feature below. Answer with exactly one
+word: SIMPLE (a few lines in one file), MODERATE or COMPLEX.
+
+FEATURE:
+{feature_description}
+"""
+
+_CREATE_TESTS_TEMPLATE = _SYSTEM_PREFIX + """
+You are a senior QA engineer. Create pytest tests for the feature described below, covering
+normal cases, edge cases and error handling, then run them and report the results.
+
+Return a dictionary with:
+1. "test_files": List of test files created
+2. "passed": Number of passing tests
+3. "failed": Number of failing tests
+4. "summary": A summary of the results
+""" + _SEPARATOR + """
+FEATURE: {feature_name}
+
+IMPLEMENTATION:
+{implementation_info}
+"""
+
+_REVIEW_CODE_TEMPLATE = _SYSTEM_PREFIX + """
+You are a senior code reviewer. Review the implementation of the feature described below for
+code quality, potential bugs, documentation, security and test coverage, and suggest specific
+improvements.
+
+Return a dictionary with:
+1. "issues": List of problems found, each with the file it is in
+2. "suggestions": List of specific improvements
+3. "summary": An overall assessment
+""" + _SEPARATOR + """
+FEATURE: {feature_name}
+
+IMPLEMENTATION:
+{implementation_info}
+
+TEST RESULTS:
+{test_results}
+"""
+
+# Tool module names by tool-set name, matching the keys of tools_status
+_TOOL_MODULES = {
+    "filesystem": "filesystem_tools",
+    "code": "code_tools",
+    "test": "test_tools",
+    "github": "github_tools",
+    "environment": "environment_tools"
+}
+
+# Filesystem tools every file-handling agent starts with
+_BASE_FS_TOOLS = (
+    ("filesystem", "list_directory"),
+    ("filesystem", "read_file"),
+    ("filesystem", "read_files"),
+    ("filesystem", "write_file"),
+    ("filesystem", "write_files")
+)
+
+# (tool set, tool name) pairs per agent; tools from unavailable sets are skipped
+_AGENT_TOOL_SPEC = {
+    "architect": _BASE_FS_TOOLS + (
+        ("filesystem", "create_directory"),
+        ("filesystem", "get_absolute_path"),
+        ("code", "analyze_code")
+    ),
+    "developer": _BASE_FS_TOOLS + (
+        ("filesystem", "create_directory"),
+        ("code", "analyze_code"),
+        ("code", "format_code"),
+        ("code", "fix_code"),
+        ("code", "fix_directory_structure"),
+        ("code", "validate_python_code"),
+        ("github", "create_issue"),
+        ("github", "create_branch"),
+        ("github", "commit_changes"),
+        ("github", "create_pull_request")
+    ),
+    "tester": _BASE_FS_TOOLS + (
+        ("test", "generate_test"),
+        ("test", "run_tests"),
+        ("test", "run_coverage")
+    ),
+    "reviewer": _BASE_FS_TOOLS + (
+        ("code", "analyze_code"),
+        ("github", "create_pull_request")
+    ),
+    "environment_setup": (
+        ("environment", "setup_virtual_environment"),
+        ("environment", "install_dependencies"),
+        ("environment", "extract_dependencies_from_code"),
+        ("environment", "create_requirements_file")
+    )
+}
+
+# Step budget per orchestrator task; each step is a full model round-trip
+_TASK_MAX_STEPS = {
+    "analyze_requirements": 4,
+    "implement_feature": 12,
+    "implement_simple_feature": 15,
+    "create_tests": 10,
+    "review_code": 6,
+    "run_manager": 25
+}
+
+# Agent name -> (model configuration to use, authorized imports, description)
+_AGENT_SETTINGS = {
+    "architect": (
+        "architect",
+        BASE_AUTHORIZED_IMPORTS + ("sys", "re"),
+        "Designs the overall system architecture and component relationships"
+    ),
+    "developer": (
+        "developer",
+        BASE_AUTHORIZED_IMPORTS + ("sys", "re", "datetime", "typing"),
+        "Implements code based on requirements and architecture designs"
+    ),
+    "tester": (
+        "tester",
+        BASE_AUTHORIZED_IMPORTS + ("pytest", "unittest", "sys"),
+        "Creates and runs tests to validate implemented code"
+    ),
+    "reviewer": (
+        "reviewer",
+        BASE_AUTHORIZED_IMPORTS + ("re",),
+        "Reviews code quality and generates documentation"
+    ),
+    "environment_setup": (
+        "architect",  # Reuse the architect model
+        BASE_AUTHORIZED_IMPORTS + ("sys", "subprocess", "venv"),
+        "Sets up Python environments and manages dependencies for projects"
+    )
+}
+
+# Feature complexity classes; SIMPLE features skip the separate tester and reviewer runs
+FEATURE_COMPLEXITIES = ("SIMPLE", "MODERATE", "COMPLEX")
+
+# Receives each agent step as it completes
+StepCallback = Callable[[Any], None]
+
+AGENT_NAMES = ("architect", "developer", "tester", "reviewer", "environment_setup", "manager")
+
+# Directories never searched for tests: VCS metadata, environments, caches and build output
+_SKIP_DIRS = frozenset({
+    ".git", ".venv", "venv", "node_modules", "__pycache__", ".tox", ".mypy_cache", ".pytest_cache", "dist", "build"
+})
+
+# File name patterns that mark a test module
+_TEST_PREFIXES = ("test_",)
+_TEST_SUFFIXES = (".py",)
+
+def _iter_test_files(root: str) -> Iterator[str]:
+    """
+    Find test_*.py files under a directory
+    
+    Args:
+        root: Directory to search
+        
+    Yields:
+        Paths of test files, skipping hidden and vendored directories
+    """
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in _SKIP_DIRS and not entry.name.startswith("."):
+                yield from _iter_test_files(entry.path)
+        elif entry.name.startswith(_TEST_PREFIXES) and entry.name.endswith(_TEST_SUFFIXES) and entry.is_file():
+            yield entry.path
+
+def _tool_module(module_name: str) -> Any:
+    """Import a module from code_agent.tools"""
+    return importlib.import_module(f"..tools.{module_name}", __package__)
+
+class _TestTotals:
+    """Running pass/fail totals across test runs"""
+    
+    __slots__ = ("total", "passed", "failed")
+    
+    def __init__(self):
+        self.total = self.passed = self.failed = 0
+    
+    def add(self, summary: Dict[str, Any]) -> None:
+        """Add one run's summary to the totals"""
+        self.total += summary.get("total", 0)
+        self.passed += summary.get("passed", 0)
+        self.failed += summary.get("failed", 0)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Summary in the shape run_all_tests returns"""
+        rate = self.passed / self.total * 100 if self.total else 0
+        return {
+            "total_tests": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "success_rate": f"{rate:.2f}%"
+        }
+
+class ToolSet:
+    """Tool modules by tool-set name; sets that failed to initialize are None"""
+    
+    __slots__ = tuple(_TOOL_MODULES) + ("_agent_tools",)
+    
+    def __init__(self, tools_status: Dict[str, bool]):
+        for name, module_name in _TOOL_MODULES.items():
+            setattr(self, name, _tool_module(module_name) if tools_status.get(name, True) else None)
+        self._agent_tools: Dict[str, tuple] = {}
+    
+    def for_agent(self, agent_name: str) -> tuple:
+        """
+        Get an agent's tools, resolved once per agent
+        
+        Args:
+            agent_name: Agent name
+            
+        Returns:
+            Tool objects from the agent's spec, skipping unavailable tool sets
+        """
+        tools = self._agent_tools.get(agent_name)
+        if tools is None:
+            tools = self._agent_tools[agent_name] = tuple(
+                getattr(getattr(self, ns), name)
+                for ns, name in _AGENT_TOOL_SPEC[agent_name]
+                if getattr(self, ns) is not None
+            )
+        return tools
+
+class _LazyModel:
+    """
+    Model stand-in that creates the real model the first time it is used
+    
+    Building an agent, or a manager over all of them, then costs no model setup
+    until a model is actually called.
+    """
+    
+    __slots__ = ("_build", "_model", "_lock")
+    
+    def __init__(self, build: Callable[[], Any]):
+        self._build = build
+        self._model = None
+        self._lock = threading.Lock()
+    
+    def _get(self) -> Any:
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = self._build()
+        return self._model
+    
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._get()(*args, **kwargs)
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+class _LazyAgents(Mapping):
+    """
+    Read-only name -> agent mapping that builds each agent on first access
+    
+    Agents can also be read as attributes, e.g. agents.architect.
+    """
+    
+    __slots__ = ("_orchestrator",)
+    
+    def __init__(self, orchestrator: "AgentOrchestrator"):
+        self._orchestrator = orchestrator
+    
+    def __getitem__(self, name: str) -> "CodeAgent":
+        if name not in AGENT_NAMES:
+            raise KeyError(name)
+        return getattr(self._orchestrator, name)
+    
+    def __getattr__(self, name: str) -> "CodeAgent":
+        if name not in AGENT_NAMES:
+            raise AttributeError(name)
+        return getattr(self._orchestrator, name)
+    
+    def __contains__(self, name: object) -> bool:
+        # Checking for an agent shouldn't build it
+        return name in AGENT_NAMES
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(AGENT_NAMES)
+    
+    def __len__(self) -> int:
+        return len(AGENT_NAMES)
 
 class AgentOrchestrator:
     """
@@ -19,10 +408,6 @@ class AgentOrchestrator:
             config: Application configuration
             project_path: Path to the project directory (optional)
         """
-        # Validate configuration first
-        if not config.validate():
-            logger.warning("Invalid configuration. GitHub integration may not work properly.")
-            
         self.config = config
         
         # Create projects directory
@@ -51,7 +436,12 @@ class AgentOrchestrator:
         # Ensure the project path exists
         os.makedirs(self.project_path, exist_ok=True)
         
-        self.agents = {}
+        self.agents = _LazyAgents(self)
+        self._pools: Dict[str, AgentPool] = {}
+        self._models: Dict[tuple, _LazyModel] = {}
+        self._run_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._run_cache_lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = defaultdict(CircuitBreaker)
         self.tools_status = {
             "filesystem": False,
             "code": False,
@@ -59,16 +449,16 @@ class AgentOrchestrator:
             "github": False
         }
         
-        # Initialize tools
+        # Initialize tools; agents are built on first use
         self._init_tools()
-        
-        # Initialize specialized agents
-        self._init_agents()
+        self.tools = ToolSet(self.tools_status)
         
         logger.info(f"Agent Orchestrator initialized with project path: {self.project_path}")
     
     def _init_tools(self):
         """Initialize all tool sets with status tracking"""
+        from ..tools import github_tools, filesystem_tools, code_tools, test_tools
+        
         try:
             # Set project paths in all tool modules
             filesystem_tools.set_base_path(self.project_path)
@@ -96,230 +486,770 @@ class AgentOrchestrator:
                 logger.warning("GitHub credentials not provided. GitHub integration disabled.")
             
             # Log tools status
-            initialized_tools = [k for k, v in self.tools_status.items() if v]
-            logger.info(f"Tools initialized: {', '.join(initialized_tools)}")
+            logger.info(f"Tools initialized: {', '.join(name for name, ready in self.tools_status.items() if ready)}")
             
         except Exception as e:
             logger.error(f"Error initializing tools: {str(e)}")
     
-    def _init_agents(self):
-        """Initialize specialized agents with validation"""
-        try:
-            # Validate that we have at least filesystem tools
-            if not self.tools_status["filesystem"]:
-                raise ValueError("Filesystem tools must be initialized before creating agents")
-            
-            # Create model instances for each agent
-            from ..models import ModelManager
-            model_manager = ModelManager()
-            
-            # Validate model IDs
-            for agent_name, agent_config in self.config.agents.items():
-                if not agent_config.model_id:
-                    logger.warning(f"Model ID for {agent_name} agent is not specified")
+    @functools.cached_property
+    def _model_manager(self):
+        """Model manager shared by all agents of this orchestrator, created when a model is first used"""
+        # Validated here rather than up front, so tool-only use skips it
+        if not self.config.validate():
+            logger.warning("Invalid configuration. GitHub integration may not work properly.")
+        
+        from ..models import ModelManager
+        return ModelManager()
+    
+    def _get_model(self, agent_name: str) -> "_LazyModel":
+        """
+        Get the model for an agent, created on its first call
+        
+        Args:
+            agent_name: Name of the agent configuration to use
             
-            # Create model instances for each agent using the model manager
-            models = {}
+        Returns:
+            Model instance
+        """
+        agent_config = self.config.agents[agent_name]
+        if not agent_config.model_id:
+            raise ValueError(f"Model ID for {agent_name} agent is not specified")
+        
+        # Agents configured alike share one model
+        key = (agent_config.model_id, agent_config.provider, agent_config.temperature, agent_config.max_tokens,
+               tuple(agent_config.endpoints))
+        model = self._models.get(key)
+        if model is None:
+            model = self._models[key] = self._lazy_model(agent_name, agent_config)
+        return model
+    
+    def _lazy_model(self, agent_name: str, agent_config: AgentConfig) -> "_LazyModel":
+        """Wrap the model for an agent configuration so it is created on first call"""
+        def build() -> Any:
             try:
-                for agent_name, agent_config in self.config.agents.items():
-                    if agent_config.model_id:
-                        models[agent_name] = model_manager.get_model(
-                            model_id=agent_config.model_id,
-                            provider=agent_config.provider,
-                            temperature=agent_config.temperature,
-                            max_tokens=agent_config.max_tokens
-                        )
-                logger.info("All models initialized successfully")
+                return self._model_manager.get_model(
+                    model_id=agent_config.model_id,
+                    provider=agent_config.provider,
+                    temperature=agent_config.temperature,
+                    max_tokens=agent_config.max_tokens,
+                    endpoints=agent_config.endpoints or None
+                )
             except Exception as e:
-                error_msg = f"Failed to initialize models: {str(e)}"
+                error_msg = f"Failed to initialize model for {agent_name}: {str(e)}"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
+        
+        return _LazyModel(build)
+    
+    def _agent_kwargs(self, agent_name: str) -> Dict[str, Any]:
+        """
+        Build the CodeAgent arguments for a specialized agent
+        
+        Args:
+            agent_name: Agent name
             
-            # Rest of the original _init_agents method
-            # Architect agent tools
-            architect_tools = [
-                filesystem_tools.list_directory,
-                filesystem_tools.read_file,
-                filesystem_tools.write_file,
-                filesystem_tools.create_directory,
-                filesystem_tools.absolute_path,
-                code_tools.analyze_code if self.tools_status["code"] else None
-            ]
-            architect_tools = [tool for tool in architect_tools if tool is not None]
-            
-            # Developer agent tools
-            developer_tools = [
-                filesystem_tools.list_directory,
-                filesystem_tools.read_file,
-                filesystem_tools.write_file,
-                filesystem_tools.create_directory
-            ]
-            
-            if self.tools_status["code"]:
-                developer_tools.extend([
-                    code_tools.analyze_code,
-                    code_tools.format_code,
-                    code_tools.fix_code,
-                    code_tools.fix_directory_structure,
-                    code_tools.validate_python_code
-                ])
-            
-            # Add GitHub tools if available
-            if self.tools_status["github"]:
-                developer_tools.extend([
-                    github_tools.create_issue,
-                    github_tools.create_branch,
-                    github_tools.commit_changes,
-                    github_tools.create_pull_request
-                ])
+        Returns:
+            Keyword arguments for CodeAgent
+        """
+        # Validate that we have at least filesystem tools
+        if self.tools.filesystem is None:
+            raise ValueError("Filesystem tools must be initialized before creating agents")
+        
+        model_name, imports, description = _AGENT_SETTINGS[agent_name]
+        agent_config = self.config.agents[model_name]
+        return dict(
+            model=self._get_model(model_name),
+            tools=list(self.tools.for_agent(agent_name)),
+            additional_authorized_imports=list(imports),
+            name=agent_name,
+            description=description,
+            max_steps=agent_config.max_steps,
+            verbosity_level=agent_config.verbosity_level
+        )
+    
+    def _build_agent(self, agent_name: str) -> "CodeAgent":
+        """
+        Create a specialized agent and the pool that lends out copies of it
+        
+        Args:
+            agent_name: Agent name
             
-            # Tester agent tools
-            tester_tools = [
-                filesystem_tools.list_directory,
-                filesystem_tools.read_file,
-                filesystem_tools.write_file
-            ]
+        Returns:
+            CodeAgent instance
+        """
+        from smolagents import CodeAgent
+        
+        try:
+            kwargs = self._agent_kwargs(agent_name)
+            agent = CodeAgent(**kwargs)
+        except Exception as e:
+            error_msg = f"Failed to initialize {agent_name} agent: {str(e)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        # Concurrent feature pipelines each lease their own instance
+        self._pools[agent_name] = AgentPool(functools.partial(CodeAgent, **kwargs), agent)
+        logger.info(f"{agent_name} agent initialized")
+        return agent
+    
+    @functools.cached_property
+    def architect(self) -> "CodeAgent":
+        """Architect agent, built on first use"""
+        return self._build_agent("architect")
+    
+    @functools.cached_property
+    def developer(self) -> "CodeAgent":
+        """Developer agent, built on first use"""
+        return self._build_agent("developer")
+    
+    @functools.cached_property
+    def tester(self) -> "CodeAgent":
+        """Tester agent, built on first use"""
+        return self._build_agent("tester")
+    
+    @functools.cached_property
+    def reviewer(self) -> "CodeAgent":
+        """Reviewer agent, built on first use"""
+        return self._build_agent("reviewer")
+    
+    @functools.cached_property
+    def environment_setup(self) -> "CodeAgent":
+        """Environment setup agent, built on first use"""
+        return self._build_agent("environment_setup")
+    
+    @functools.cached_property
+    def managed_agents(self) -> Tuple["CodeAgent", ...]:
+        """Specialized agents the manager delegates to, fixed for the orchestrator's lifetime"""
+        return (self.architect, self.developer, self.tester, self.reviewer, self.environment_setup)
+    
+    @functools.cached_property
+    def manager(self) -> "CodeAgent":
+        """Manager agent that can use all other agents, built on first use"""
+        from smolagents import CodeAgent
+        
+        try:
+            return CodeAgent(
+                model=self._get_model("architect"),  # Use architect's model for manager
+                tools=[],  # No direct tools, uses managed agents instead
+                additional_authorized_imports=list(BASE_AUTHORIZED_IMPORTS + ("sys",)),
+                name="manager",
+                description="Manages and coordinates tasks between specialized agents",
+                max_steps=self.config.agents["architect"].max_steps,
+                verbosity_level=self.config.agents["architect"].verbosity_level,
+                managed_agents=list(self.managed_agents)
+            )
+        except Exception as e:
+            error_msg = f"Failed to initialize manager agent: {str(e)}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+    
+    def set_project_path(self, path: Union[str, Path]) -> None:
+        """
+        Set the project path for all tools
+        
+        Relative paths are taken relative to the projects directory. The path is
+        resolved once here and handed to the tools as is.
+        
+        Args:
+            path: New project path
+        """
+        resolved = Path(path)
+        if not resolved.is_absolute():
+            resolved = Path.cwd() / "projects" / resolved
+        
+        # Resolving strictly validates the path in the same pass
+        try:
+            resolved = resolved.resolve(strict=True)
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValueError(f"Project path does not exist: {path}")
+        
+        self._resolved_project_path = resolved
+        self.project_path = str(resolved)
+        
+        # Update project path in tools
+        from ..tools import filesystem_tools, code_tools, test_tools
+        filesystem_tools.set_base_path(resolved)
+        code_tools.set_project_path(resolved)
+        test_tools.set_project_path(resolved)
+        
+        logger.info(f"Project path updated to: {self.project_path}")
+    
+    def analyze_requirements(self, requirements: str, on_chunk: Optional[StepCallback] = None) -> Dict[str, Any]:
+        """
+        Analyze project requirements into an architecture and features
+        
+        Args:
+            requirements: Project requirements text
+            on_chunk: Called with each agent step as it completes (optional)
             
-            if self.tools_status["test"]:
-                tester_tools.extend([
-                    test_tools.generate_test,
-                    test_tools.run_tests,
-                    test_tools.run_coverage
-                ])
+        Returns:
+            Dictionary with "architecture" and "features"
+        """
+        cache_key = self._analysis_cache_key(requirements)
+        cached = self._read_analysis_cache(cache_key)
+        if cached is not None:
+            return cached
+        
+        prompt = _ANALYZE_REQUIREMENTS_TEMPLATE.format_map({"requirements": requirements})
+        analysis = self._parse_analysis(
+            self._run_sync("architect", prompt, on_chunk, _TASK_MAX_STEPS["analyze_requirements"])
+        )
+        self._write_analysis_cache(cache_key, analysis)
+        return analysis
+    
+    def implement_feature(self, feature_name: str, feature_description: str, architecture_info: str,
+                          on_chunk: Optional[StepCallback] = None) -> Any:
+        """
+        Implement a feature
+        
+        Args:
+            feature_name: Feature name
+            feature_description: Feature description
+            architecture_info: Architecture information to follow
+            on_chunk: Called with each agent step as it completes (optional)
             
-            # Reviewer agent tools
-            reviewer_tools = [
-                filesystem_tools.list_directory,
-                filesystem_tools.read_file,
-                filesystem_tools.write_file
-            ]
+        Returns:
+            Implementation results
+        """
+        return self._run_sync(
+            "developer", self._implement_feature_prompt(feature_name, feature_description, architecture_info), on_chunk,
+            _TASK_MAX_STEPS["implement_feature"]
+        )
+    
+    def create_tests(self, feature_name: str, implementation_info: Any,
+                     on_chunk: Optional[StepCallback] = None) -> Any:
+        """
+        Create and run tests for an implemented feature
+        
+        Args:
+            feature_name: Feature name
+            implementation_info: Information about the feature implementation
+            on_chunk: Called with each agent step as it completes (optional)
             
+        Returns:
+            Testing results
+        """
+        return self._run_sync(
+            "tester", self._create_tests_prompt(feature_name, implementation_info), on_chunk,
+            _TASK_MAX_STEPS["create_tests"]
+        )
+    
+    def review_code(self, feature_name: str, implementation_info: Any, test_results: Any,
+                    on_chunk: Optional[StepCallback] = None) -> Any:
+        """
+        Review the code of an implemented feature
+        
+        Args:
+            feature_name: Feature name
+            implementation_info: Information about the feature implementation
+            test_results: Results from testing the feature
+            on_chunk: Called with each agent step as it completes (optional)
             
-            if self.tools_status["code"]:
-                reviewer_tools.append(code_tools.analyze_code)
+        Returns:
+            Review results
+        """
+        return self._run_sync(
+            "reviewer", self._review_code_prompt(feature_name, implementation_info, test_results), on_chunk,
+            _TASK_MAX_STEPS["review_code"]
+        )
+    
+    def implement_simple_feature(self, feature_name: str, feature_description: str, architecture_info: str,
+                                 on_chunk: Optional[StepCallback] = None) -> Any:
+        """
+        Implement, test and self-review a simple feature in one developer run
+        
+        Args:
+            feature_name: Feature name
+            feature_description: Feature description
+            architecture_info: Architecture information to follow
+            on_chunk: Called with each agent step as it completes (optional)
             
-            # Add GitHub tools for reviewer if available
-            if self.tools_status["github"]:
-                reviewer_tools.extend([
-                    github_tools.create_pull_request
-                ])
-                
-            # Environment setup tools
-            environment_tools = [
-                environment_tools.setup_virtual_environment,
-                environment_tools.install_dependencies,
-                environment_tools.extract_dependencies_from_code,
-                environment_tools.create_requirements_file
-            ]
+        Returns:
+            Combined results with "files", "tests" and "review"
+        """
+        return self._run_sync(
+            "developer",
+            self._implement_simple_feature_prompt(feature_name, feature_description, architecture_info),
+            on_chunk,
+            _TASK_MAX_STEPS["implement_simple_feature"]
+        )
+    
+    def run_manager(self, request: str, on_chunk: Optional[StepCallback] = None) -> Any:
+        """
+        Handle a free-form request with the manager agent
+        
+        Args:
+            request: User request text
+            on_chunk: Called with each step of the manager and of the agents it
+                delegates to, as they complete (optional)
             
-            # Create the agents
-            self.agents["architect"] = CodeAgent(
-                model=models.get("architect"),
-                tools=architect_tools,
-                additional_authorized_imports=["os", "pathlib", "json", "sys", "re"],
-                name="architect",
-                description="Designs the overall system architecture and component relationships",
-                max_steps=20,
-                verbosity_level=1
-            )
+        Returns:
+            Manager response
+        """
+        if on_chunk is None:
+            return self._run_sync("manager", request, max_steps=_TASK_MAX_STEPS["run_manager"])
+        
+        # Managed agents run without streaming, so forward their steps through
+        # their step callbacks for the duration of this request
+        managed = self.managed_agents
+        for agent in managed:
+            agent.step_callbacks.append(on_chunk)
+        try:
+            return self._run_sync("manager", request, on_chunk, _TASK_MAX_STEPS["run_manager"])
+        finally:
+            for agent in managed:
+                agent.step_callbacks.remove(on_chunk)
+    
+    def _run_sync(self, agent_name: str, prompt: str, on_chunk: Optional[StepCallback] = None,
+                  max_steps: Optional[int] = None) -> Any:
+        """
+        Run an agent, optionally streaming its steps to a callback
+        
+        Args:
+            agent_name: Name of the agent to run
+            prompt: The prompt to run
+            on_chunk: Called with each agent step as it completes (optional)
+            max_steps: Step budget for this run; the agent's default if not given
             
-            self.agents["developer"] = CodeAgent(
-                model=models.get("developer"),
-                tools=developer_tools,
-                additional_authorized_imports=["os", "pathlib", "json", "sys", "re", "datetime", "typing"],
-                name="developer",
-                description="Implements code based on requirements and architecture designs",
-                max_steps=20,
-                verbosity_level=1
-            )
+        Returns:
+            Agent response
             
-            self.agents["tester"] = CodeAgent(
-                model=models.get("tester"),
-                tools=tester_tools,
-                additional_authorized_imports=["os", "pathlib", "json", "pytest", "unittest", "sys"],
-                name="tester",
-                description="Creates and runs tests to validate implemented code",
-                max_steps=20,
-                verbosity_level=1
-            )
+        Raises:
+            TimeoutError: If the run exceeds config.agent_timeout, or the agent's breaker is open
+        """
+        agent = self.agents[agent_name]
+        max_steps = max_steps or agent.max_steps
+        key = None
+        if on_chunk is None:
+            key = self._run_cache_key(agent_name, prompt)
+            result = self._get_cached_run(key)
+            if result is not _MISSING:
+                return result
+        
+        breaker = self._breakers[agent_name]
+        if not breaker.allow():
+            raise TimeoutError(f"The {agent_name} agent keeps timing out; not retrying until it cools down")
+        
+        timeout = getattr(self.config, "agent_timeout", None)
+        if on_chunk is None:
+            # Same as _run_agent: a timed-out run keeps its worker thread, but nothing waits on it
+            future = _get_agent_executor().submit(agent.run, prompt, max_steps=max_steps)
+            try:
+                result = future.result(timeout=timeout)
+            except FuturesTimeoutError:
+                breaker.record_failure()
+                raise TimeoutError(f"The {agent_name} agent did not finish within {timeout} seconds")
+            breaker.record_success()
+            self._put_cached_run(key, result)
+            return result
+        
+        # Steps are handed to on_chunk on this thread, so the deadline is checked between steps
+        deadline = time.monotonic() + timeout if timeout else None
+        step = None
+        for step in agent.run(prompt, stream=True, max_steps=max_steps):
+            on_chunk(step)
+            if deadline is not None and time.monotonic() > deadline:
+                breaker.record_failure()
+                raise TimeoutError(f"The {agent_name} agent did not finish within {timeout} seconds")
+        breaker.record_success()
+        # The last streamed item carries the final answer
+        return getattr(step, "output", step)
+    
+    async def implement_simple_feature_async(self, feature_name: str, feature_description: str,
+                                             architecture_info: str) -> Any:
+        """Async variant of implement_simple_feature"""
+        return await self._run_agent(
+            "developer", self._implement_simple_feature_prompt(feature_name, feature_description, architecture_info),
+            _TASK_MAX_STEPS["implement_simple_feature"]
+        )
+    
+    def _classify_feature(self, feature_description: str) -> str:
+        """
+        Classify a feature's complexity with a single short model call
+        
+        Args:
+            feature_description: Feature description
             
-            self.agents["reviewer"] = CodeAgent(
-                model=models.get("reviewer"),
-                tools=reviewer_tools,
-                additional_authorized_imports=["os", "pathlib", "json", "re"],
-                name="reviewer",
-                description="Reviews code quality and generates documentation",
-                max_steps=20,
-                verbosity_level=1
+        Returns:
+            One of FEATURE_COMPLEXITIES; COMPLEX when the answer is unusable
+        """
+        prompt = _CLASSIFY_FEATURE_TEMPLATE.format_map({"feature_description": feature_description})
+        try:
+            message = self._get_model("architect")(
+                [{"role": "user", "content": [{"type": "text", "text": prompt}]}],
+                max_tokens=8
             )
+        except Exception as e:
+            logger.warning(f"Feature classification failed: {str(e)}")
+            return "COMPLEX"
+        
+        answer = str(getattr(message, "content", message)).strip().upper()
+        return next((label for label in FEATURE_COMPLEXITIES if answer.startswith(label)), "COMPLEX")
+    
+    async def analyze_requirements_async(self, requirements: str) -> Dict[str, Any]:
+        """Async variant of analyze_requirements"""
+        cache_key = self._analysis_cache_key(requirements)
+        cached = self._read_analysis_cache(cache_key)
+        if cached is not None:
+            return cached
+        
+        prompt = _ANALYZE_REQUIREMENTS_TEMPLATE.format_map({"requirements": requirements})
+        analysis = self._parse_analysis(
+            await self._run_agent("architect", prompt, _TASK_MAX_STEPS["analyze_requirements"])
+        )
+        self._write_analysis_cache(cache_key, analysis)
+        return analysis
+    
+    async def implement_feature_async(self, feature_name: str, feature_description: str,
+                                      architecture_info: str) -> Any:
+        """Async variant of implement_feature"""
+        return await self._run_agent(
+            "developer", self._implement_feature_prompt(feature_name, feature_description, architecture_info),
+            _TASK_MAX_STEPS["implement_feature"]
+        )
+    
+    async def create_tests_async(self, feature_name: str, implementation_info: Any) -> Any:
+        """Async variant of create_tests"""
+        return await self._run_agent(
+            "tester", self._create_tests_prompt(feature_name, implementation_info), _TASK_MAX_STEPS["create_tests"]
+        )
+    
+    async def review_code_async(self, feature_name: str, implementation_info: Any, test_results: Any) -> Any:
+        """Async variant of review_code"""
+        return await self._run_agent(
+            "reviewer", self._review_code_prompt(feature_name, implementation_info, test_results),
+            _TASK_MAX_STEPS["review_code"]
+        )
+    
+    def build_application(self, requirements: str, project_name: str,
+                          precomputed_architecture: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build an application from requirements
+        
+        Args:
+            requirements: Project requirements text
+            project_name: Project name
+            precomputed_architecture: Analysis with "architecture" and "features" to use
+                instead of running the architect (optional)
             
-            self.agents["environment_setup"] = CodeAgent(
-                model=models.get("architect"),  # Reuse the architect model
-                tools=environment_tools,
-                additional_authorized_imports=["os", "pathlib", "json", "sys", "subprocess", "venv"],
-                name="environment_setup",
-                description="Sets up Python environments and manages dependencies for projects",
-                max_steps=20,
-                verbosity_level=1
-            )
+        Returns:
+            Build results with the architecture and per-feature outcomes
+        """
+        return asyncio.run(self.build_application_async(requirements, project_name, precomputed_architecture))
+    
+    async def build_application_async(self, requirements: str, project_name: str,
+                                      precomputed_architecture: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build an application, running the per-feature pipelines concurrently
+        
+        The architect runs once to enumerate features, unless an analysis is
+        supplied or one was saved for the same requirements by an earlier build;
+        each feature is then implemented, tested and reviewed independently.
+        
+        Args:
+            requirements: Project requirements text
+            project_name: Project name
+            precomputed_architecture: Analysis with "architecture" and "features" to use
+                instead of running the architect (optional)
             
-            # Manager agent that can use all other agents
-            self.agents["manager"] = CodeAgent(
-                model=models.get("architect"),  # Use architect's model for manager
-                tools=[],  # No direct tools, uses managed agents instead
-                additional_authorized_imports=["os", "pathlib", "json", "sys"],
-                name="manager",
-                description="Manages and coordinates tasks between specialized agents",
-                max_steps=20,
-                verbosity_level=1,
-                managed_agents=[
-                    self.agents["architect"],
-                    self.agents["developer"],
-                    self.agents["tester"],
-                    self.agents["reviewer"],
-                    self.agents["environment_setup"]
-                ]
+        Returns:
+            Build results with the architecture and per-feature outcomes
+        """
+        logger.info(f"Building application '{project_name}'")
+        
+        if precomputed_architecture is not None:
+            analysis = self._parse_analysis(precomputed_architecture)
+        else:
+            analysis = self._load_cached_architecture(requirements)
+            if analysis is None:
+                analysis = await self.analyze_requirements_async(requirements)
+                self._save_cached_architecture(requirements, analysis)
+        
+        architecture = analysis["architecture"]
+        features = analysis["features"]
+        logger.info(f"Identified {len(features)} features")
+        
+        # A fixed set of workers pulls features off the queue, so a worker that
+        # finishes a short feature moves straight on to the next one
+        queue: "asyncio.Queue[int]" = asyncio.Queue()
+        for index in range(len(features)):
+            queue.put_nowait(index)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(features)
+        workers = min(len(features), self.config.max_parallel_features or DEFAULT_MAX_PARALLEL_FEATURES)
+        await asyncio.gather(*(self._feature_worker(queue, features, architecture, results) for _ in range(workers)))
+        
+        return {
+            "project_name": project_name,
+            "architecture": architecture,
+            "features": results,
+            "status": "success" if all(r["status"] == "success" for r in results) else "partial"
+        }
+    
+    def _analysis_cache_key(self, requirements: str) -> Optional[str]:
+        """
+        Key a requirements analysis by everything that shapes it
+        
+        Returns:
+            Cache prompt for the analysis namespace, or None when response caching is disabled
+        """
+        if not getattr(self.config, "enable_response_cache", False):
+            return None
+        
+        model_id = self.config.agents["architect"].model_id
+        project_name = os.path.basename(self.project_path)
+        return f"analyze_requirements|{model_id}|{requirements}|{project_name}"
+    
+    @functools.cached_property
+    def _response_cache(self) -> ResponseCache:
+        """On-disk response cache for memoized analyses, opened on first use"""
+        # Keys embed the model and project, so only exact matches are meaningful
+        return ResponseCache(semantic=False)
+    
+    def _read_analysis_cache(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Load a memoized analysis, or None on a miss"""
+        if key is None:
+            return None
+        
+        cached = self._response_cache.get(ANALYSIS_CACHE_NAMESPACE, key)
+        if cached is not None:
+            logger.info("Using memoized requirements analysis")
+        return cached
+    
+    def _write_analysis_cache(self, key: Optional[str], analysis: Dict[str, Any]) -> None:
+        """Memoize an analysis that found features"""
+        if key is None or not analysis.get("features"):
+            return
+        self._response_cache.put(ANALYSIS_CACHE_NAMESPACE, key, analysis)
+    
+    def _cached_architecture_path(self) -> str:
+        """Path of the saved requirements analysis for the current project"""
+        return os.path.join(self.project_path, ".codeagent", "architecture.json")
+    
+    def _load_cached_architecture(self, requirements: str) -> Optional[Dict[str, Any]]:
+        """Load the saved analysis if it was made for these exact requirements"""
+        try:
+            with open(self._cached_architecture_path(), "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if cached.get("requirements_sha256") != hashlib.sha256(requirements.encode("utf-8")).hexdigest():
+            return None
+        
+        logger.info("Using saved architecture; skipping requirements analysis")
+        return self._parse_analysis(cached.get("analysis"))
+    
+    def _save_cached_architecture(self, requirements: str, analysis: Dict[str, Any]) -> None:
+        """Save an analysis so later builds with the same requirements can skip the architect"""
+        path = self._cached_architecture_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "requirements_sha256": hashlib.sha256(requirements.encode("utf-8")).hexdigest(),
+                    "analysis": analysis
+                }, f, indent=2, default=str)
+        except OSError as e:
+            logger.warning(f"Could not save architecture: {str(e)}")
+    
+    async def _feature_worker(self, queue: "asyncio.Queue[int]", features: List[Dict[str, Any]],
+                              architecture: Any, results: List[Optional[Dict[str, Any]]]) -> None:
+        """Run feature pipelines off the queue until it is empty, storing each outcome by index"""
+        while not queue.empty():
+            index = queue.get_nowait()
+            feature = features[index]
+            try:
+                results[index] = await self._feature_pipeline(feature, architecture)
+            except Exception as e:
+                logger.error(f"Feature '{feature.get('name')}' failed: {str(e)}")
+                results[index] = {"name": feature.get("name"), "status": "error", "message": str(e)}
+    
+    async def _feature_pipeline(self, feature: Dict[str, Any], architecture: Any) -> Dict[str, Any]:
+        """Implement, test and review one feature"""
+        name = feature.get("name", "")
+        description = feature.get("description", "")
+        complexity = str(feature.get("complexity", "")).upper()
+        if complexity not in FEATURE_COMPLEXITIES:
+            complexity = await run_blocking(functools.partial(self._classify_feature, description))
+        
+        if complexity == "SIMPLE":
+            # One combined run; fall back to the full pipeline if its answer can't be used
+            combined = parse_json_response(
+                await self.implement_simple_feature_async(name, description, architecture)
             )
-            
-            logger.info("All agents initialized successfully")
-        except Exception as e:
-            error_msg = f"Failed to initialize agents: {str(e)}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+            if combined is not None and {"files", "tests", "review"} <= combined.keys():
+                return {
+                    "name": name,
+                    "status": "success",
+                    "implementation": {"files": combined["files"]},
+                    "tests": combined["tests"],
+                    "review": combined["review"]
+                }
+        
+        implementation = await self.implement_feature_async(name, description, architecture)
+        
+        # Testing and review both only need the implementation, so they run side by side
+        tests, review = await asyncio.gather(
+            self.create_tests_async(name, implementation),
+            self.review_code_async(name, implementation, _TEST_RESULTS_PENDING)
+        )
+        
+        # Review again with the results only when there are failures to look at
+        if self._tests_failed(tests):
+            review = await self.review_code_async(name, implementation, tests)
+        
+        return {
+            "name": name,
+            "status": "success",
+            "implementation": implementation,
+            "tests": tests,
+            "review": review
+        }
+    
+    @staticmethod
+    def _tests_failed(tests: Any) -> bool:
+        """Check whether the tester reported failing tests"""
+        results = parse_json_response(tests)
+        if results is None:
+            return False
+        try:
+            return int(results.get("failed") or 0) > 0
+        except (TypeError, ValueError):
+            return False
     
-    def set_project_path(self, path: str) -> None:
+    async def _run_agent(self, agent_name: str, prompt: str, max_steps: Optional[int] = None) -> Any:
         """
-        Set the project path for all tools
+        Run an agent without blocking the event loop
         
         Args:
-            path: New project path
+            agent_name: Name of the agent to run
+            prompt: The prompt to run
+            max_steps: Step budget for this run; the agent's default if not given
+            
+        Returns:
+            Agent response
+            
+        Raises:
+            TimeoutError: If the run exceeds config.agent_timeout, or the agent's breaker is open
         """
-        # Validate the path
-        if not os.path.exists(path):
-            raise ValueError(f"Project path does not exist: {path}")
+        key = self._run_cache_key(agent_name, prompt)
+        result = self._get_cached_run(key)
+        if result is not _MISSING:
+            return result
         
-        # Ensure the path is either absolute or relative to the projects directory
-        if not os.path.isabs(path):
-            projects_dir = os.path.join(os.getcwd(), "projects")
-            path = os.path.join(projects_dir, path)
+        breaker = self._breakers[agent_name]
+        if not breaker.allow():
+            raise TimeoutError(f"The {agent_name} agent keeps timing out; not retrying until it cools down")
         
-        self.project_path = path
+        # Make sure the agent and its pool exist before going to a worker thread
+        self.agents[agent_name]
         
-        # Update project path in tools
-        filesystem_tools.set_base_path(path)
-        code_tools.set_project_path(path)
-        test_tools.set_project_path(path)
+        def call() -> Any:
+            # Each concurrent call gets its own agent so their memories don't mix
+            with self._pools[agent_name].lease() as agent:
+                return agent.run(prompt, max_steps=max_steps or agent.max_steps)
+        
+        timeout = getattr(self.config, "agent_timeout", None)
+        try:
+            # A timed-out run keeps its worker thread until the agent returns, but nothing waits on it
+            result = await asyncio.wait_for(run_blocking(call), timeout=timeout)
+        except asyncio.TimeoutError:
+            breaker.record_failure()
+            raise TimeoutError(f"The {agent_name} agent did not finish within {timeout} seconds")
+        breaker.record_success()
+        
+        self._put_cached_run(key, result)
+        return result
+    
+    def _run_cache_key(self, agent_name: str, prompt: str) -> Optional[tuple]:
+        """Key an agent run for the in-memory cache, or None when the run is not cached"""
+        if agent_name not in _CACHEABLE_AGENTS or not getattr(self.config, "enable_prompt_cache", True):
+            return None
+        return agent_name, hashlib.sha1(prompt.encode("utf-8")).digest()
+    
+    def _get_cached_run(self, key: Optional[tuple]) -> Any:
+        """Look up an earlier result for the same agent and prompt; _MISSING on a miss"""
+        if key is None:
+            return _MISSING
+        with self._run_cache_lock:
+            result = self._run_cache.get(key, _MISSING)
+            if result is not _MISSING:
+                self._run_cache.move_to_end(key)
+            return result
+    
+    def _put_cached_run(self, key: Optional[tuple], result: Any) -> None:
+        """Remember a result, dropping the least recently used one past RUN_CACHE_SIZE"""
+        if key is None:
+            return
+        with self._run_cache_lock:
+            self._run_cache[key] = result
+            self._run_cache.move_to_end(key)
+            if len(self._run_cache) > RUN_CACHE_SIZE:
+                self._run_cache.popitem(last=False)
+    
+    @staticmethod
+    def _parse_analysis(response: Any) -> Dict[str, Any]:
+        """Normalize the architect's analysis into architecture and features"""
+        analysis = parse_json_response(response)
+        if analysis is None:
+            logger.warning("Requirements analysis was not valid JSON; treating it as a single feature")
+            return {"architecture": response, "features": [{"name": "application", "description": str(response)}]}
         
-        logger.info(f"Project path updated to: {path}")
+        features = analysis.get("features") or []
+        analysis["features"] = [
+            feature if isinstance(feature, dict) else {"name": str(feature), "description": str(feature)}
+            for feature in features
+        ]
+        analysis.setdefault("architecture", "")
+        return analysis
+    
+    @staticmethod
+    def _implement_feature_prompt(feature_name: str, feature_description: str, architecture_info: Any) -> str:
+        """Build the developer prompt for a feature"""
+        return _IMPLEMENT_FEATURE_TEMPLATE.format_map({
+            "architecture_info": architecture_info,
+            "feature_name": feature_name,
+            "feature_description": feature_description
+        })
     
-    def run_all_tests(self) -> Dict[str, Any]:
+    @staticmethod
+    def _implement_simple_feature_prompt(feature_name: str, feature_description: str, architecture_info: Any) -> str:
+        """Build the combined implement/test/review prompt for a simple feature"""
+        return _IMPLEMENT_SIMPLE_FEATURE_TEMPLATE.format_map({
+            "architecture_info": architecture_info,
+            "feature_name": feature_name,
+            "feature_description": feature_description
+        })
+    
+    @staticmethod
+    def _create_tests_prompt(feature_name: str, implementation_info: Any) -> str:
+        """Build the tester prompt for a feature"""
+        return _CREATE_TESTS_TEMPLATE.format_map({
+            "feature_name": feature_name,
+            "implementation_info": implementation_info
+        })
+    
+    @staticmethod
+    def _review_code_prompt(feature_name: str, implementation_info: Any, test_results: Any) -> str:
+        """Build the reviewer prompt for a feature"""
+        return _REVIEW_CODE_TEMPLATE.format_map({
+            "feature_name": feature_name,
+            "implementation_info": implementation_info,
+            "test_results": test_results
+        })
+    
+    def run_all_tests(self, isolated: bool = False) -> Dict[str, Any]:
         """
         Run all tests in the project
         
+        Args:
+            isolated: Give each test file or directory its own pytest process
+            
         Returns:
             Test results
         """
-        if not self.tools_status["test"]:
+        if self.tools.test is None:
             logger.warning("Test tools not available")
             return {"status": "error", "message": "Test tools not available"}
         
@@ -337,47 +1267,40 @@ class AgentOrchestrator:
         
         # If no test directory found, look for test files
         if not test_files:
-            for root, _, files in os.walk(self.project_path):
-                for file in files:
-                    if file.startswith("test_") and file.endswith(".py"):
-                        test_files.append(os.path.join(root, file))
-        
-        # Run tests if found
-        if test_files:
-            logger.info(f"Found {len(test_files)} test files/directories")
-            
-            all_results = {}
-            for test_file in test_files:
-                logger.info(f"Running tests in: {test_file}")
-                result = test_tools.run_tests(test_file)
-                all_results[test_file] = result
-            
-            # Calculate overall summary
-            total_tests = 0
-            total_passed = 0
-            total_failed = 0
-            
-            for result in all_results.values():
-                if isinstance(result, dict) and "summary" in result:
-                    summary = result["summary"]
-                    total_tests += summary.get("total", 0)
-                    total_passed += summary.get("passed", 0)
-                    total_failed += summary.get("failed", 0)
-            
-            return {
-                "test_files": test_files,
-                "detailed_results": all_results,
-                "summary": {
-                    "total_tests": total_tests,
-                    "passed": total_passed,
-                    "failed": total_failed,
-                    "success_rate": f"{(total_passed / total_tests * 100) if total_tests > 0 else 0:.2f}%"
-                }
-            }
-        else:
+            test_files.extend(_iter_test_files(self.project_path))
+        
+        if not test_files:
             logger.warning("No tests found in the project")
             return {
                 "test_files": [],
                 "detailed_results": {},
                 "summary": "No tests found in the project"
-            }
\ No newline at end of file
+            }
+        
+        logger.info(f"Found {len(test_files)} test files/directories")
+        
+        totals = _TestTotals()
+        
+        if isolated and len(test_files) > 1:
+            # Each run is its own pytest subprocess, so threads are enough to run them side by side
+            workers = min(len(test_files), os.cpu_count() or 1)
+            all_results = {}
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Totals are kept as results arrive rather than in a second pass
+                for test_file, result in zip(test_files, executor.map(self.tools.test.run_tests, test_files)):
+                    all_results[test_file] = result
+                    if isinstance(result, dict) and "summary" in result:
+                        totals.add(result["summary"])
+        else:
+            # One pytest process for everything, instead of one per file
+            batch = self.tools.test.run_tests_batch(test_files)
+            all_results = batch.get("per_path") or {test_file: batch for test_file in test_files}
+            
+            # The batch run already totals every path
+            totals.add(batch.get("summary") or {})
+        
+        return {
+            "test_files": test_files,
+            "detailed_results": all_results,
+            "summary": totals.as_dict()
+        }
\ No newline at end of file
@@ -1,22 +1,192 @@
 # code_agent/agents/reviewer.py
-from typing import List, Dict, Any, Optional
-from smolagents import HfApiModel
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
-from .base import BaseSpecializedAgent
+from .base import BASE_AUTHORIZED_IMPORTS, BaseSpecializedAgent, bulletize, compact_json, parse_json_response
+from ..utils.response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    from smolagents import HfApiModel
+
+# Review checklist shared by the single and multi-feature prompts
+_REVIEW_CHECKLIST = """
+1. Check each file for:
+   - Code quality and adherence to PEP 8
+   - Potential bugs or edge cases
+   - Documentation and docstrings
+   - Design patterns and architecture
+   - Performance issues
+2. Suggest specific improvements
+3. Highlight any security concerns
+4. Review test coverage and completeness
+
+For each file, read its content first, then provide detailed feedback.
+"""
+
+_REVIEW_CODE_PREFIX = """
+You are a senior code reviewer. Review the implementation of the feature described below.
+
+Please perform a comprehensive code review:""" + _REVIEW_CHECKLIST + """
+After reviewing, create a pull request if GitHub tools are available.
+"""
+
+_REVIEW_CODE_TEMPLATE = _REVIEW_CODE_PREFIX + """
+FEATURE:
+Name: {name}
+Description: {description}
+
+IMPLEMENTATION FILES:
+{files}
+
+TEST RESULTS:
+{test_results}
+"""
+
+_REVIEW_CODES_PREFIX = """
+You are a senior code reviewer. Review the implementations of all the features listed below
+in a single pass.
+
+For every feature, perform a comprehensive code review:""" + _REVIEW_CHECKLIST + """
+Your final answer must be a JSON object mapping each feature name to its review.
+"""
+
+_REVIEW_CODES_TEMPLATE = _REVIEW_CODES_PREFIX + """
+FEATURES:
+{features}
+"""
+
+_GENERATE_DOCUMENTATION_PREFIX = """
+You are a technical documentation specialist. Generate comprehensive documentation for the
+feature described below.
+
+Please:
+1. Extract relevant information from each file
+2. Document the feature's architecture and design decisions
+3. Create usage examples
+4. Document public APIs and interfaces
+5. Identify any configuration or environment requirements
+
+For each file, read its content first to understand the implementation.
+
+Generate the documentation in Markdown format and save it to an appropriate location in the docs directory.
+"""
+
+_GENERATE_DOCUMENTATION_TEMPLATE = _GENERATE_DOCUMENTATION_PREFIX + """
+FEATURE:
+Name: {name}
+Description: {description}
+
+IMPLEMENTATION FILES:
+{files}
+"""
+
+_CREATE_PULL_REQUEST_PREFIX = """
+You are a DevOps engineer. Create a pull request for the feature described below.
+
+Please:
+1. Create a detailed pull request title and description
+2. Include a summary of changes made
+3. Reference any issues addressed by this PR
+4. Highlight test coverage and results
+5. Note any important implementation details or design decisions
+
+Use the GitHub tools to create the pull request from the feature branch to the main branch.
+"""
+
+_CREATE_PULL_REQUEST_TEMPLATE = _CREATE_PULL_REQUEST_PREFIX + """
+FEATURE:
+Name: {name}
+Description: {description}
+
+BRANCH:
+{branch_name}
+
+REVIEW RESULTS:
+{review_results}
+"""
+
+_CHECK_SECURITY_PREFIX = """
+You are a security analyst. Check the files listed below for security issues.
+
+Please:
+1. Identify any potential security vulnerabilities
+   - Input validation issues
+   - Authentication flaws
+   - Authorization problems
+   - Data exposure risks
+   - Injection vulnerabilities
+   - Cryptographic issues
+2. Suggest specific fixes for each issue
+3. Rate the severity of each issue (low, medium, high, critical)
+
+For each file, read its content first to understand the implementation.
+
+Provide a comprehensive security analysis report.
+"""
+
+_CHECK_SECURITY_TEMPLATE = _CHECK_SECURITY_PREFIX + """
+IMPLEMENTATION FILES:
+{files}
+"""
+
+_REVIEW_ARCHITECTURE_PREFIX = """
+You are a software architect. Review the overall project architecture given below.
+
+Please:
+1. Evaluate the overall architecture
+   - Component organization
+   - Separation of concerns
+   - Modularity
+   - Dependency management
+2. Identify any architectural issues or anti-patterns
+3. Suggest improvements to enhance maintainability and scalability
+4. Assess the project's adherence to design principles (SOLID, DRY, etc.)
+
+Provide a detailed architecture review with specific recommendations.
+"""
+
+_REVIEW_ARCHITECTURE_TEMPLATE = _REVIEW_ARCHITECTURE_PREFIX + """
+PROJECT STRUCTURE:
+{project_structure}
+"""
+
+_API_DOCUMENTATION_PREFIX = """
+You are an API documentation specialist. Generate comprehensive API documentation for the
+files listed below.
+
+Please:
+1. Extract API endpoints, parameters, and return values
+2. Document request and response formats
+3. Provide usage examples for each endpoint
+4. Note any authentication or authorization requirements
+5. Document error responses and status codes
+
+For each file, read its content first to understand the implementation.
+
+Generate the API documentation in Markdown format and save it to the docs/api directory.
+"""
+
+_API_DOCUMENTATION_TEMPLATE = _API_DOCUMENTATION_PREFIX + """
+API FILES:
+{files}
+"""
+
+_IMPORTS = BASE_AUTHORIZED_IMPORTS + ("re", "ast", "inspect")
 
 class ReviewerAgent(BaseSpecializedAgent):
     """Agent specialized in code review and documentation"""
     
-    def __init__(self, model: HfApiModel, tools: List[Any]):
+    max_steps = 8
+    
+    def __init__(self, model: "HfApiModel", tools: List[Any], cache: Optional[ResponseCache] = None):
         """
         Initialize reviewer agent
         
         Args:
             model: HfApiModel instance
             tools: List of tools
+            cache: Response cache (optional)
         """
-        imports = ["os", "pathlib", "json", "re", "ast", "inspect"]
-        super().__init__("reviewer", model, tools, imports)
+        super().__init__("reviewer", model, tools, _IMPORTS, cache)
     
     def get_description(self) -> str:
         """Return the agent description"""
@@ -30,7 +200,8 @@ class ReviewerAgent(BaseSpecializedAgent):
         self, 
         feature: Dict[str, Any], 
         implementation_files: List[str], 
-        test_results: Dict[str, Any]
+        test_results: Dict[str, Any],
+        files_str: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Review code for a feature
@@ -39,47 +210,73 @@ class ReviewerAgent(BaseSpecializedAgent):
             feature: Feature details
             implementation_files: List of files implemented for the feature
             test_results: Results from testing
+            files_str: implementation_files already formatted with bulletize, for
+                callers that pass the same list to several review methods (optional)
             
         Returns:
             Review results
         """
-        files_str = "\n".join([f"- {file}" for file in implementation_files])
+        if files_str is None:
+            files_str = bulletize(implementation_files)
         
-        prompt = f"""
-        You are a senior code reviewer. Review the implementation of the following feature:
+        prompt = _REVIEW_CODE_TEMPLATE.format_map({
+            "name": feature['name'],
+            "description": feature['description'],
+            "files": files_str,
+            "test_results": compact_json(test_results)
+        })
         
-        FEATURE:
-        Name: {feature['name']}
-        Description: {feature['description']}
-        
-        IMPLEMENTATION FILES:
-        {files_str}
-        
-        TEST RESULTS:
-        {test_results}
-        
-        Please perform a comprehensive code review:
-        1. Check each file for:
-           - Code quality and adherence to PEP 8
-           - Potential bugs or edge cases
-           - Documentation and docstrings
-           - Design patterns and architecture
-           - Performance issues
-        2. Suggest specific improvements
-        3. Highlight any security concerns
-        4. Review test coverage and completeness
+        return self.run(prompt)
+    
+    def review_codes(
+        self,
+        features: List[Dict[str, Any]],
+        files_per_feature: Dict[str, List[str]],
+        test_results_per_feature: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Review several features in one agent run
         
-        For each file, read its content first, then provide detailed feedback.
+        Features the combined answer doesn't cover are reviewed one at a time.
         
-        After reviewing, create a pull request if GitHub tools are available.
+        Args:
+            features: List of feature details
+            files_per_feature: Implementation files by feature name
+            test_results_per_feature: Test results by feature name
+            
+        Returns:
+            Review results by feature name
         """
-        
-        return self.run(prompt)
+        features_json = compact_json([
+            {
+                "name": feature['name'],
+                "description": feature['description'],
+                "implementation_files": files_per_feature.get(feature['name'], []),
+                "test_results": test_results_per_feature.get(feature['name'], {})
+            }
+            for feature in features
+        ])
+        
+        prompt = _REVIEW_CODES_TEMPLATE.format_map({"features": features_json})
+        reviews = parse_json_response(self.run(prompt)) or {}
+        
+        for feature in features:
+            if feature['name'] not in reviews:
+                files = files_per_feature.get(feature['name'], [])
+                reviews[feature['name']] = self.review_code(
+                    feature,
+                    files,
+                    test_results_per_feature.get(feature['name'], {}),
+                    files_str=bulletize(files)
+                )
+        
+        return reviews
     
     def generate_documentation(
         self,
         feature: Dict[str, Any],
-        implementation_files: List[str]
+        implementation_files: List[str],
+        files_str: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate documentation for a feature
@@ -87,33 +284,19 @@ class ReviewerAgent(BaseSpecializedAgent):
         Args:
             feature: Feature details
             implementation_files: List of files implemented for the feature
+            files_str: implementation_files already formatted with bulletize (optional)
             
         Returns:
             Documentation results
         """
-        files_str = "\n".join([f"- {file}" for file in implementation_files])
-        
-        prompt = f"""
-        You are a technical documentation specialist. Generate comprehensive documentation for the following feature:
-        
-        FEATURE:
-        Name: {feature['name']}
-        Description: {feature['description']}
+        if files_str is None:
+            files_str = bulletize(implementation_files)
         
-        IMPLEMENTATION FILES:
-        {files_str}
-        
-        Please:
-        1. Extract relevant information from each file
-        2. Document the feature's architecture and design decisions
-        3. Create usage examples
-        4. Document public APIs and interfaces
-        5. Identify any configuration or environment requirements
-        
-        For each file, read its content first to understand the implementation.
-        
-        Generate the documentation in Markdown format and save it to an appropriate location in the docs directory.
-        """
+        prompt = _GENERATE_DOCUMENTATION_TEMPLATE.format_map({
+            "name": feature['name'],
+            "description": feature['description'],
+            "files": files_str
+        })
         
         return self.run(prompt)
     
@@ -134,67 +317,34 @@ class ReviewerAgent(BaseSpecializedAgent):
         Returns:
             Pull request results
         """
-        prompt = f"""
-        You are a DevOps engineer. Create a pull request for the following feature:
-        
-        FEATURE:
-        Name: {feature['name']}
-        Description: {feature['description']}
-        
-        BRANCH:
-        {branch_name}
-        
-        REVIEW RESULTS:
-        {review_results}
-        
-        Please:
-        1. Create a detailed pull request title and description
-        2. Include a summary of changes made
-        3. Reference any issues addressed by this PR
-        4. Highlight test coverage and results
-        5. Note any important implementation details or design decisions
-        
-        Use the GitHub tools to create the pull request from the feature branch to the main branch.
-        """
+        prompt = _CREATE_PULL_REQUEST_TEMPLATE.format_map({
+            "name": feature['name'],
+            "description": feature['description'],
+            "branch_name": branch_name,
+            "review_results": compact_json(review_results)
+        })
         
         return self.run(prompt)
     
     def check_security_issues(
         self,
-        implementation_files: List[str]
+        implementation_files: List[str],
+        files_str: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Check for security issues in implemented code
         
         Args:
             implementation_files: List of files to check
+            files_str: implementation_files already formatted with bulletize (optional)
             
         Returns:
             Security analysis results
         """
-        files_str = "\n".join([f"- {file}" for file in implementation_files])
+        if files_str is None:
+            files_str = bulletize(implementation_files)
         
-        prompt = f"""
-        You are a security analyst. Check the following files for security issues:
-        
-        IMPLEMENTATION FILES:
-        {files_str}
-        
-        Please:
-        1. Identify any potential security vulnerabilities
-           - Input validation issues
-           - Authentication flaws
-           - Authorization problems
-           - Data exposure risks
-           - Injection vulnerabilities
-           - Cryptographic issues
-        2. Suggest specific fixes for each issue
-        3. Rate the severity of each issue (low, medium, high, critical)
-        
-        For each file, read its content first to understand the implementation.
-        
-        Provide a comprehensive security analysis report.
-        """
+        prompt = _CHECK_SECURITY_TEMPLATE.format_map({"files": files_str})
         
         return self.run(prompt)
     
@@ -211,58 +361,30 @@ class ReviewerAgent(BaseSpecializedAgent):
         Returns:
             Architecture review results
         """
-        prompt = f"""
-        You are a software architect. Review the overall project architecture:
-        
-        PROJECT STRUCTURE:
-        {project_structure}
-        
-        Please:
-        1. Evaluate the overall architecture
-           - Component organization
-           - Separation of concerns
-           - Modularity
-           - Dependency management
-        2. Identify any architectural issues or anti-patterns
-        3. Suggest improvements to enhance maintainability and scalability
-        4. Assess the project's adherence to design principles (SOLID, DRY, etc.)
-        
-        Provide a detailed architecture review with specific recommendations.
-        """
+        prompt = _REVIEW_ARCHITECTURE_TEMPLATE.format_map({
+            "project_structure": compact_json(project_structure)
+        })
         
         return self.run(prompt)
     
     def generate_api_documentation(
         self,
-        api_files: List[str]
+        api_files: List[str],
+        files_str: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate API documentation for REST APIs or libraries
         
         Args:
             api_files: List of API implementation files
+            files_str: api_files already formatted with bulletize (optional)
             
         Returns:
             API documentation results
         """
-        files_str = "\n".join([f"- {file}" for file in api_files])
-        
-        prompt = f"""
-        You are an API documentation specialist. Generate comprehensive API documentation for the following files:
+        if files_str is None:
+            files_str = bulletize(api_files)
         
-        API FILES:
-        {files_str}
-        
-        Please:
-        1. Extract API endpoints, parameters, and return values
-        2. Document request and response formats
-        3. Provide usage examples for each endpoint
-        4. Note any authentication or authorization requirements
-        5. Document error responses and status codes
-        
-        For each file, read its content first to understand the implementation.
-        
-        Generate the API documentation in Markdown format and save it to the docs/api directory.
-        """
+        prompt = _API_DOCUMENTATION_TEMPLATE.format_map({"files": files_str})
         
         return self.run(prompt) 
@@ -1,21 +1,163 @@
-from typing import List, Dict, Any, Optional
-from smolagents import HfApiModel, CodeAgent
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
-from .base import BaseSpecializedAgent
+from .base import (
+    BASE_AUTHORIZED_IMPORTS, BaseSpecializedAgent, bulletize, compact_json, entry_path, parse_json_response
+)
+from ..utils.response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    from smolagents import HfApiModel
+
+_CREATE_TESTS_PREFIX = """
+You are a senior QA engineer. Create comprehensive tests for the feature described below.
+
+Please:
+1. Examine each implementation file to understand what needs to be tested
+2. Create appropriate test files using pytest
+3. Write tests for both normal cases and edge cases
+4. Test error handling and boundary conditions
+5. Run the tests and report results
+6. Calculate test coverage
+
+For each implementation file:
+1. Create a corresponding test file
+2. Ensure test functions follow pytest naming conventions
+3. Add appropriate assertions
+4. Include test fixtures if needed
+
+Specific steps to follow:
+1. First explore the project structure using filesystem_tools to locate the implementation files
+2. Read each implementation file to understand its functionality
+3. Generate test files with pytest test cases for each component
+4. Organize tests in a proper directory structure
+5. Use test_tools to run tests and measure coverage
+6. Provide a detailed report of test results
+
+Focus on testing functionality, edge cases, and error conditions.
+"""
+
+_CREATE_TESTS_TEMPLATE = _CREATE_TESTS_PREFIX + """
+FEATURE: {feature_name}
+
+IMPLEMENTATION FILES:
+{files}
+"""
+
+_CREATE_TESTS_BATCH_PREFIX = """
+You are a senior QA engineer. Create comprehensive tests for each of the features listed below.
+
+For each feature:
+1. Examine each implementation file to understand what needs to be tested
+2. Create appropriate test files using pytest, one per implementation file
+3. Write tests for both normal cases and edge cases
+4. Test error handling and boundary conditions
+5. Ensure test functions follow pytest naming conventions
+6. Use test_tools to run the tests and measure coverage
+
+Your final answer must be a JSON object mapping each feature name to a report of its
+test files and test results.
+"""
+
+_CREATE_TESTS_BATCH_TEMPLATE = _CREATE_TESTS_BATCH_PREFIX + """
+FEATURES:
+{features}
+"""
+
+_RUN_TESTS_PREFIX = """
+Run the tests in the locations listed below.
+
+Please:
+1. Use the test_tools.run_tests function for each path
+2. Collect and analyze the results
+3. Generate a coverage report
+4. Identify any failing tests
+5. Summarize the overall test quality
+
+Report back with:
+1. Test pass/fail statistics
+2. Coverage metrics
+3. Failing test details if any
+4. Recommendations for test improvements
+"""
+
+_RUN_TESTS_TEMPLATE = _RUN_TESTS_PREFIX + """
+TEST PATHS:
+{paths}
+"""
+
+_ANALYZE_COVERAGE_PREFIX = """
+Analyze the test coverage for the feature named below, based on its test results.
+
+Please:
+1. Calculate code coverage statistics
+2. Identify any untested code paths
+3. Recommend additional tests to improve coverage
+4. Evaluate the quality of existing tests
+
+Consider:
+- Line coverage
+- Branch coverage
+- Exception handling coverage
+- Edge case coverage
+
+Use test_tools.run_coverage to gather detailed coverage information.
+
+Provide a comprehensive coverage report with recommendations for improvement.
+"""
+
+_ANALYZE_COVERAGE_TEMPLATE = _ANALYZE_COVERAGE_PREFIX + """
+FEATURE: {feature_name}
+
+TEST RESULTS:
+{test_results}
+"""
+
+_GENERATE_TEST_SUITE_PREFIX = """
+Generate a comprehensive test suite for the module at the path given below.
+
+Please:
+1. Examine the module structure using filesystem_tools
+2. Generate test files for all components in the module
+3. Include unit tests, integration tests, and edge case tests
+4. Organize tests in a logical directory structure
+5. Implement proper test fixtures and setup/teardown
+6. Add docstrings and comments to explain test coverage
+
+Use test_tools.generate_test_suite to automate test generation.
+Ensure the test suite covers:
+- All public methods and functions
+- Error handling paths
+- Edge cases and boundary conditions
+- Input validation
+- Integration between components
+
+Implement the tests, run them, and report the results.
+"""
+
+_GENERATE_TEST_SUITE_TEMPLATE = _GENERATE_TEST_SUITE_PREFIX + """
+MODULE PATH: {module_path}
+
+FEATURE DESCRIPTION:
+{feature_description}
+"""
+
+_IMPORTS = BASE_AUTHORIZED_IMPORTS + ("pytest", "unittest", "sys", "re")
 
 class TesterAgent(BaseSpecializedAgent):
     """Agent specialized in test creation and execution"""
     
-    def __init__(self, model: HfApiModel, tools: List[Any]):
+    max_steps = 12
+    
+    def __init__(self, model: "HfApiModel", tools: List[Any], cache: Optional[ResponseCache] = None):
         """
         Initialize tester agent
         
         Args:
             model: HfApiModel instance
             tools: List of tools
+            cache: Response cache (optional)
         """
-        imports = ["os", "pathlib", "json", "pytest", "unittest", "sys", "re"]
-        super().__init__("tester", model, tools, imports)
+        super().__init__("tester", model, tools, _IMPORTS, cache)
     
     def get_description(self) -> str:
         """Return the agent description"""
@@ -38,43 +180,44 @@ class TesterAgent(BaseSpecializedAgent):
         """
         # Extract files from implementation info if available
         files = implementation_info.get("files", [])
-        files_str = "\n".join([f"- {file.get('path', file)}" for file in files]) if files else "No files provided."
-        
-        prompt = f"""
-        You are a senior QA engineer. Create comprehensive tests for the following feature:
-        
-        FEATURE: {feature_name}
-        
-        IMPLEMENTATION FILES:
-        {files_str}
-        
-        Please:
-        1. Examine each implementation file to understand what needs to be tested
-        2. Create appropriate test files using pytest
-        3. Write tests for both normal cases and edge cases
-        4. Test error handling and boundary conditions
-        5. Run the tests and report results
-        6. Calculate test coverage
-        
-        For each implementation file:
-        1. Create a corresponding test file
-        2. Ensure test functions follow pytest naming conventions
-        3. Add appropriate assertions
-        4. Include test fixtures if needed
-        
-        Specific steps to follow:
-        1. First explore the project structure using filesystem_tools to locate the implementation files
-        2. Read each implementation file to understand its functionality
-        3. Generate test files with pytest test cases for each component
-        4. Organize tests in a proper directory structure
-        5. Use test_tools to run tests and measure coverage
-        6. Provide a detailed report of test results
-        
-        Focus on testing functionality, edge cases, and error conditions.
-        """
+        files_str = bulletize(files) if files else "No files provided."
+        
+        prompt = _CREATE_TESTS_TEMPLATE.format_map({
+            "feature_name": feature_name,
+            "files": files_str
+        })
         
         return self.run(prompt)
     
+    def create_tests_batch(self, implementations: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create tests for several features in one agent run
+        
+        Features the combined answer doesn't cover get tests created one at a time.
+        
+        Args:
+            implementations: Implementation details by feature name
+            
+        Returns:
+            Test results by feature name
+        """
+        features_str = "\n".join(
+            "- {}: {}".format(
+                feature_name,
+                ", ".join(entry_path(file) for file in info.get("files", [])) or "No files provided."
+            )
+            for feature_name, info in implementations.items()
+        )
+        
+        prompt = _CREATE_TESTS_BATCH_TEMPLATE.format_map({"features": features_str})
+        results = parse_json_response(self.run(prompt)) or {}
+        
+        for feature_name, info in implementations.items():
+            if feature_name not in results:
+                results[feature_name] = self.create_tests(feature_name, info)
+        
+        return results
+    
     def run_tests(self, test_paths: List[str]) -> Dict[str, Any]:
         """
         Run existing tests
@@ -85,27 +228,9 @@ class TesterAgent(BaseSpecializedAgent):
         Returns:
             Test results
         """
-        paths_str = "\n".join([f"- {path}" for path in test_paths])
-        
-        prompt = f"""
-        Run the tests in the following locations:
-        
-        TEST PATHS:
-        {paths_str}
-        
-        Please:
-        1. Use the test_tools.run_tests function for each path
-        2. Collect and analyze the results
-        3. Generate a coverage report
-        4. Identify any failing tests
-        5. Summarize the overall test quality
-        
-        Report back with:
-        1. Test pass/fail statistics
-        2. Coverage metrics
-        3. Failing test details if any
-        4. Recommendations for test improvements
-        """
+        paths_str = bulletize(test_paths)
+        
+        prompt = _RUN_TESTS_TEMPLATE.format_map({"paths": paths_str})
         
         return self.run(prompt)
     
@@ -120,28 +245,10 @@ class TesterAgent(BaseSpecializedAgent):
         Returns:
             Coverage analysis
         """
-        prompt = f"""
-        Analyze the test coverage for feature "{feature_name}" based on the test results.
-        
-        TEST RESULTS:
-        {test_results}
-        
-        Please:
-        1. Calculate code coverage statistics
-        2. Identify any untested code paths
-        3. Recommend additional tests to improve coverage
-        4. Evaluate the quality of existing tests
-        
-        Consider:
-        - Line coverage
-        - Branch coverage
-        - Exception handling coverage
-        - Edge case coverage
-        
-        Use test_tools.run_coverage to gather detailed coverage information.
-        
-        Provide a comprehensive coverage report with recommendations for improvement.
-        """
+        prompt = _ANALYZE_COVERAGE_TEMPLATE.format_map({
+            "feature_name": feature_name,
+            "test_results": compact_json(test_results)
+        })
         
         return self.run(prompt)
     
@@ -156,29 +263,9 @@ class TesterAgent(BaseSpecializedAgent):
         Returns:
             Generated test suite
         """
-        prompt = f"""
-        Generate a comprehensive test suite for the module at path "{module_path}".
-        
-        FEATURE DESCRIPTION:
-        {feature_description}
-        
-        Please:
-        1. Examine the module structure using filesystem_tools
-        2. Generate test files for all components in the module
-        3. Include unit tests, integration tests, and edge case tests
-        4. Organize tests in a logical directory structure
-        5. Implement proper test fixtures and setup/teardown
-        6. Add docstrings and comments to explain test coverage
-        
-        Use test_tools.generate_test_suite to automate test generation.
-        Ensure the test suite covers:
-        - All public methods and functions
-        - Error handling paths
-        - Edge cases and boundary conditions
-        - Input validation
-        - Integration between components
-        
-        Implement the tests, run them, and report the results.
-        """
+        prompt = _GENERATE_TEST_SUITE_TEMPLATE.format_map({
+            "module_path": module_path,
+            "feature_description": feature_description
+        })
         
         return self.run(prompt) 
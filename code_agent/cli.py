@@ -1,16 +1,15 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import os
+import sys
 import logging
-import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
-from .tools.development_manager import DevelopmentManager
+from .config import DEFAULT_CONFIG_PATH, read_json_file, write_json_file
 
-def print_banner():
-    """Print the application banner"""
-    banner = """
+_BANNER = """
     ╭───────────────────────────────────────╮
     │                                       │
     │            CODE AGENT                 │
@@ -18,20 +17,48 @@ def print_banner():
     │      AI-Powered Development Team      │
     │                                       │
     ╰───────────────────────────────────────╯
-    """
-    print(banner)
-    
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("code_agent_cli.log"),
-        logging.StreamHandler()
-    ]
-)
+    """ "\n"
+
+def print_banner():
+    """Print the application banner"""
+    # One write of the finished text; print() would add the newline separately
+    sys.stdout.write(_BANNER)
+    
 logger = logging.getLogger("code_agent_cli")
 
+def _configure_logging() -> None:
+    """Send log records to the console and, unless CODE_AGENT_NO_LOG is set, to a log file"""
+    handlers = [logging.StreamHandler()]
+    if os.environ.get("CODE_AGENT_NO_LOG") != "1":
+        # The file is only created once something is logged
+        handlers.append(logging.FileHandler("code_agent_cli.log", delay=True))
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+
+@functools.lru_cache(maxsize=8)
+def _read_config_file(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Read and parse a config file, remembered per modification time
+    
+    Args:
+        config_path: Path to config file
+        mtime_ns: Modification time of the file, so edits made elsewhere are seen
+        
+    Returns:
+        Settings from the file, or an empty dictionary if it can't be read
+    """
+    try:
+        return read_json_file(config_path)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.error(f"Error loading config from {config_path}: {str(e)}")
+        return {}
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load configuration from file
@@ -44,7 +71,7 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """
     # Default config path
     if not config_path:
-        config_path = os.path.join(str(Path.home()), ".code_agent", "config.json")
+        config_path = DEFAULT_CONFIG_PATH
     
     # Default configuration
     config = {
@@ -54,14 +81,12 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         "project_root": os.environ.get("PROJECT_ROOT", os.getcwd())
     }
     
-    # Load from file if it exists
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, 'r') as f:
-                file_config = json.load(f)
-                config.update(file_config)
-        except Exception as e:
-            logger.error(f"Error loading config from {config_path}: {str(e)}")
+    # Load from file if it exists; the cached dict is shared, so copy it in
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        return config
+    config.update(_read_config_file(config_path, mtime_ns))
     
     return config
 
@@ -75,18 +100,61 @@ def save_config(config: Dict[str, Any], config_path: Optional[str] = None) -> No
     """
     # Default config path
     if not config_path:
-        config_path = os.path.join(str(Path.home()), ".code_agent", "config.json")
+        config_path = DEFAULT_CONFIG_PATH
     
     # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(config_path), exist_ok=True)
+    config_dir = os.path.dirname(config_path)
+    if config_dir and not os.path.isdir(config_dir):
+        os.makedirs(config_dir, exist_ok=True)
     
     # Save config
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        write_json_file(config_path, config)
         logger.info(f"Configuration saved to {config_path}")
     except Exception as e:
         logger.error(f"Error saving config to {config_path}: {str(e)}")
+    finally:
+        # The next load must see what was just written
+        _read_config_file.cache_clear()
+
+def read_stdin() -> str:
+    """
+    Read everything on standard input up to end of file
+    
+    Piped input is read through sys.stdin in one go: earlier input() calls may
+    already have pulled the rest of the pipe into its buffers, and read() takes
+    those plus the remaining bytes in a single read and decode.
+    
+    Returns:
+        Text read from standard input
+    """
+    return sys.stdin.read().strip()
+
+def prompt_many(prompts: List[str]) -> List[str]:
+    """
+    Ask several questions and return the stripped answers in order
+    
+    When input is piped, all prompts are written and flushed once and the
+    answers are read as consecutive lines; a terminal gets one prompt at a time.
+    
+    Args:
+        prompts: Prompt texts
+        
+    Returns:
+        One answer per prompt, empty where input ran out
+    """
+    if len(prompts) < 2 or sys.stdin.isatty():
+        answers = []
+        for prompt in prompts:
+            try:
+                answers.append(input(prompt).strip())
+            except EOFError:
+                answers.append("")
+        return answers
+    
+    sys.stdout.write("\n".join(prompts) + "\n")
+    sys.stdout.flush()
+    return [sys.stdin.readline().strip() for _ in prompts]
 
 def init_command(args):
     """Initialize Code Agent configuration"""
@@ -96,37 +164,32 @@ def init_command(args):
     # Load existing config
     config = load_config(args.config)
     
-    # Get GitHub token
-    if args.github_token:
-        github_token = args.github_token
-    else:
-        github_token = input(f"Enter your GitHub token (current: {config.get('github_token', '')[:4] + '...' if config.get('github_token') else 'None'}): ").strip()
-        if not github_token:
-            github_token = config.get("github_token", "")
-    
-    # Get GitHub username
-    if args.github_username:
-        github_username = args.github_username
-    else:
-        github_username = input(f"Enter your GitHub username (current: {config.get('github_username', 'None')}): ").strip()
-        if not github_username:
-            github_username = config.get("github_username", "")
+    # Value given on the command line, prompt, and fallback for each setting
+    token = config.get("github_token")
+    settings = [
+        ("github_token", args.github_token,
+         f"Enter your GitHub token (current: {token[:4] + '...' if token else 'None'}): ", ""),
+        ("github_username", args.github_username,
+         f"Enter your GitHub username (current: {config.get('github_username', 'None')}): ", ""),
+        ("model_id", args.model_id,
+         f"Enter model ID (current: {config.get('model_id', 'meta-llama/Meta-Llama-3.1-70B-Instruct')}): ",
+         "meta-llama/Meta-Llama-3.1-70B-Instruct"),
+        ("project_root", args.project_root,
+         f"Enter project root directory (current: {config.get('project_root', os.getcwd())}): ", os.getcwd())
+    ]
     
-    # Get model ID
-    if args.model_id:
-        model_id = args.model_id
-    else:
-        model_id = input(f"Enter model ID (current: {config.get('model_id', 'meta-llama/Meta-Llama-3.1-70B-Instruct')}): ").strip()
-        if not model_id:
-            model_id = config.get("model_id", "meta-llama/Meta-Llama-3.1-70B-Instruct")
+    # Ask for everything not given on the command line in one go
+    missing = [(key, prompt) for key, value, prompt, _ in settings if not value]
+    answers = dict(zip([key for key, _ in missing], prompt_many([prompt for _, prompt in missing])))
     
-    # Get project root
-    if args.project_root:
-        project_root = args.project_root
-    else:
-        project_root = input(f"Enter project root directory (current: {config.get('project_root', os.getcwd())}): ").strip()
-        if not project_root:
-            project_root = config.get("project_root", os.getcwd())
+    values = {
+        key: value or answers.get(key) or config.get(key, default)
+        for key, value, _, default in settings
+    }
+    github_token = values["github_token"]
+    github_username = values["github_username"]
+    model_id = values["model_id"]
+    project_root = values["project_root"]
     
     # Update config
     config.update({
@@ -139,11 +202,13 @@ def init_command(args):
     # Save config
     save_config(config, args.config)
     
-    print("\nConfiguration saved successfully!")
-    print(f"GitHub Token: {'✓ Set' if github_token else '✗ Not Set'}")
-    print(f"GitHub Username: {github_username if github_username else '✗ Not Set'}")
-    print(f"Model ID: {model_id}")
-    print(f"Project Root: {project_root}")
+    print(
+        "\nConfiguration saved successfully!\n"
+        f"GitHub Token: {'✓ Set' if github_token else '✗ Not Set'}\n"
+        f"GitHub Username: {github_username if github_username else '✗ Not Set'}\n"
+        f"Model ID: {model_id}\n"
+        f"Project Root: {project_root}"
+    )
 
 def build_command(args):
     """Build a project from requirements"""
@@ -158,10 +223,13 @@ def build_command(args):
         print("Warning: GitHub token not set. Repository creation disabled.")
         args.create_repo = False
     
-    projects_dir = os.path.join(os.getcwd(), "projects")
-    if not os.path.exists(projects_dir):
-        os.makedirs(projects_dir, exist_ok=True)
+    projects_dir = Path.cwd() / "projects"
+    try:
+        # A single mkdir both creates the directory and tells us it was missing
+        projects_dir.mkdir(parents=True)
         print(f"Created projects directory: {projects_dir}")
+    except FileExistsError:
+        pass
     
     # Get project name
     project_name = args.name
@@ -183,22 +251,15 @@ def build_command(args):
     requirements = ""
     if args.requirements_file:
         try:
-            with open(args.requirements_file, 'r') as f:
-                requirements = f.read()
+            # One bytes read and one decode, skipping text-mode newline scanning
+            requirements = Path(args.requirements_file).read_bytes().decode("utf-8", "replace")
         except Exception as e:
             print(f"Error reading requirements file: {str(e)}")
             return
     else:
         print("Enter project requirements (finish with Ctrl+D on Unix or Ctrl+Z on Windows):")
         try:
-            requirements_lines = []
-            while True:
-                try:
-                    line = input()
-                    requirements_lines.append(line)
-                except EOFError:
-                    break
-            requirements = "\n".join(requirements_lines)
+            requirements = read_stdin()
         except KeyboardInterrupt:
             print("\nOperation cancelled.")
             return
@@ -207,6 +268,9 @@ def build_command(args):
         print("Error: No requirements provided.")
         return
     
+    # Imported here so init and --help don't load smolagents and the GitHub client
+    from .tools.development_manager import DevelopmentManager
+    
     # Create development manager
     manager = DevelopmentManager(config)
     
@@ -227,10 +291,10 @@ def build_command(args):
     if args.create_repo and result['project'].get('repository_url'):
         print(f"GitHub repository: {result['project']['repository_url']}")
     
-    print(f"\nImplemented {len(result['feature_results'])} features:")
-    for feature_result in result['feature_results']:
-        feature = feature_result['feature']
-        print(f"- {feature['name']}: {feature['description']}")
+    features = [feature_result['feature'] for feature_result in result['feature_results']]
+    print(f"\nImplemented {len(features)} features:\n" + "\n".join(
+        f"- {feature['name']}: {feature['description']}" for feature in features
+    ))
 
 def feature_command(args):
     """Implement a specific feature"""
@@ -244,33 +308,40 @@ def feature_command(args):
     project_dir = args.project_dir
     if not project_dir:
         # List available projects in the projects directory
-        projects_path = os.path.join(os.getcwd(), "projects")
-        if os.path.exists(projects_path):
+        projects_path = Path.cwd() / "projects"
+        try:
             projects = os.listdir(projects_path)
-            if projects:
-                print("Available projects:")
-                for idx, project in enumerate(projects, 1):
-                    print(f"{idx}. {project}")
-                choice = input("Enter project number or name (or enter a new project name): ").strip()
-                
-                # Handle numeric choice
-                if choice.isdigit() and 1 <= int(choice) <= len(projects):
-                    project_dir = os.path.join(projects_path, projects[int(choice)-1])
-                else:
-                    # Handle project name choice or new project
-                    project_name = choice
-                    project_dir = os.path.join(projects_path, project_name.replace(" ", "_").lower())
+        except FileNotFoundError:
+            projects = None
+        
+        if projects:
+            print("Available projects:\n" + "\n".join(f"{idx}. {project}" for idx, project in enumerate(projects, 1)))
+            choice = input("Enter project number or name (or enter a new project name): ").strip()
+            
+            # Handle numeric choice
+            if choice.isdigit() and 1 <= int(choice) <= len(projects):
+                project_dir = projects_path / projects[int(choice)-1]
             else:
-                project_name = input("No existing projects. Enter a new project name: ").strip()
-                project_dir = os.path.join(projects_path, project_name.replace(" ", "_").lower())
+                # Handle project name choice or new project
+                project_name = choice
+                project_dir = projects_path / project_name.replace(" ", "_").lower()
         else:
-            os.makedirs(projects_path, exist_ok=True)
-            project_name = input("Enter project name: ").strip()
-            project_dir = os.path.join(projects_path, project_name.replace(" ", "_").lower())
+            if projects is None:
+                projects_path.mkdir(parents=True, exist_ok=True)
+                project_name = input("Enter project name: ").strip()
+            else:
+                project_name = input("No existing projects. Enter a new project name: ").strip()
+            project_dir = projects_path / project_name.replace(" ", "_").lower()
     
-    # Create project directory if it doesn't exist
-    if not os.path.exists(project_dir):
-        os.makedirs(project_dir, exist_ok=True)
+    # Resolve once; the manager and messages below all use this path.
+    # A strict resolve doubles as the existence check.
+    project_dir = Path(project_dir).expanduser()
+    try:
+        project_dir = project_dir.resolve(strict=True)
+    except FileNotFoundError:
+        # Create project directory if it doesn't exist
+        project_dir = project_dir.resolve()
+        project_dir.mkdir(parents=True, exist_ok=True)
         print(f"Created new project directory: {project_dir}")
     
     # Get feature name
@@ -289,6 +360,9 @@ def feature_command(args):
             print("Error: Feature description is required.")
             return
     
+    # Imported here so init and --help don't load smolagents and the GitHub client
+    from .tools.development_manager import DevelopmentManager
+    
     # Create development manager
     manager = DevelopmentManager(config)
     
@@ -297,7 +371,7 @@ def feature_command(args):
     print("This may take some time. Please be patient.")
     
     result = manager.implement_feature(
-        project_dir=project_dir,
+        project_dir=str(project_dir),
         feature={"name": feature_name, "description": feature_description}
     )
     
@@ -310,41 +384,92 @@ def feature_command(args):
         print("\nTest Summary:")
         print(result["tests"].get("summary", "Tests created and executed."))
 
-def main():
-    """Main entry point for the CLI"""
-    parser = argparse.ArgumentParser(description="Code Agent - Build complete applications with AI")
-    parser.add_argument("--config", help="Path to config file")
-    
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
-    
-    # Init command
+def _add_init_parser(subparsers) -> None:
+    """Register the init command"""
     init_parser = subparsers.add_parser("init", help="Initialize Code Agent configuration")
     init_parser.add_argument("--github-token", help="GitHub API token")
     init_parser.add_argument("--github-username", help="GitHub username")
     init_parser.add_argument("--model-id", help="Model ID for the agent")
     init_parser.add_argument("--project-root", help="Root directory for project files")
-    
-    # Build command
+    init_parser.set_defaults(func=init_command)
+
+def _add_build_parser(subparsers) -> None:
+    """Register the build command"""
     build_parser = subparsers.add_parser("build", help="Build a project from requirements")
     build_parser.add_argument("--name", help="Project name")
     build_parser.add_argument("--description", help="Project description")
     build_parser.add_argument("--requirements-file", help="Path to requirements file")
     build_parser.add_argument("--create-repo", action="store_true", help="Create GitHub repository")
-    
-    # Feature command
+    build_parser.set_defaults(func=build_command)
+
+def _add_feature_parser(subparsers) -> None:
+    """Register the feature command"""
     feature_parser = subparsers.add_parser("feature", help="Implement a specific feature")
     feature_parser.add_argument("--name", help="Feature name")
     feature_parser.add_argument("--description", help="Feature description")
     feature_parser.add_argument("--project-dir", help="Project directory")
+    feature_parser.set_defaults(func=feature_command)
+
+# Subcommand name -> function registering its parser
+_SUBPARSERS = {
+    "init": _add_init_parser,
+    "build": _add_build_parser,
+    "feature": _add_feature_parser
+}
+
+def _requested_command(argv: List[str]) -> Optional[str]:
+    """
+    Find the subcommand named on the command line, skipping global options
+    
+    Args:
+        argv: Command line arguments, without the program name
+        
+    Returns:
+        Subcommand name, or None if there is none or it is unknown
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg == "--config":
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg if arg in _SUBPARSERS else None
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the command line parser, once per process and command
+    
+    Args:
+        command: Register only this subcommand; all of them when None
+        
+    Returns:
+        Argument parser
+    """
+    parser = argparse.ArgumentParser(description="Code Agent - Build complete applications with AI")
+    parser.add_argument("--config", help="Path to config file")
+    
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    
+    # Top-level help and unknown commands need every subcommand listed
+    if command is None:
+        for add_parser in _SUBPARSERS.values():
+            add_parser(subparsers)
+    else:
+        _SUBPARSERS[command](subparsers)
+    
+    return parser
+
+def main():
+    """Main entry point for the CLI"""
+    _configure_logging()
     
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    parser = _build_parser(_requested_command(argv))
+    args = parser.parse_args(argv)
     
-    if args.command == "init":
-        init_command(args)
-    elif args.command == "build":
-        build_command(args)
-    elif args.command == "feature":
-        feature_command(args)
+    if hasattr(args, "func"):
+        args.func(args)
     else:
         parser.print_help()
 
@@ -1,9 +1,119 @@
+import logging
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import json
-import dotenv
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+except ImportError:
+    # Optional; the standard library parser is used without it
+    orjson = None
+
+# Where the configuration is kept unless a path is given
+DEFAULT_CONFIG_PATH = os.path.join(str(Path.home()), ".code_agent", "config.json")
+
+# Agent name -> environment variable that overrides its model
+_AGENT_ENV = {
+    "architect": "ARCHITECT_MODEL",
+    "developer": "DEVELOPER_MODEL",
+    "tester": "TESTER_MODEL",
+    "reviewer": "REVIEWER_MODEL"
+}
+
+# Per-agent settings saved alongside the model ID
+_AGENT_SETTINGS = ("provider", "temperature", "max_tokens", "max_steps", "verbosity_level")
+
+_DEFAULT_MODEL_ID = "meta-llama/Meta-Llama-3.1-70B-Instruct"
+
+# Seconds an orchestrated agent run may take unless configured otherwise
+DEFAULT_AGENT_TIMEOUT = 300.0
+
+# Same logger as utils.logger, without importing the utils package at startup
+logger = logging.getLogger("code_agent")
+
+_dotenv_loaded = False
+
+def load_dotenv_once() -> None:
+    """
+    Load variables from a .env file into the environment, once per process
+    
+    Every Config and ModelManager needs the variables, but the file only has
+    to be found and parsed the first time.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    
+    import dotenv
+    dotenv.load_dotenv()
+    _dotenv_loaded = True
+
+def _positive_float(value: Any, default: float, setting: str) -> float:
+    """
+    Parse a positive number setting
+    
+    Args:
+        value: Value from the environment or config file, or None if unset
+        default: Value used when the setting is unset or invalid
+        setting: Setting name for the warning about an invalid value
+        
+    Returns:
+        The parsed number, or the default
+    """
+    if value is None or value == "":
+        return default
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        number = 0.0
+    if not number > 0:
+        logger.warning(f"Invalid {setting} {value!r}; using {default}")
+        return default
+    return number
+
+def read_json_file(path: str) -> Any:
+    """
+    Parse a JSON file, with orjson when it is installed
+    
+    The file is read as bytes and parsed directly, without a text decode pass.
+    
+    Args:
+        path: File to read
+        
+    Returns:
+        Parsed data
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def write_json_file(path: str, data: Any) -> None:
+    """
+    Write data to a file as indented JSON, with orjson when it is installed
+    
+    The document is encoded up front and written straight to the descriptor.
+    New files are created readable by the owner only, since they hold tokens.
+    
+    Args:
+        path: File to write
+        data: JSON-serializable data
+    """
+    if orjson:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(data, indent=2).encode('utf-8')
+    
+    # O_BINARY keeps Windows from translating newlines
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o600)
+    try:
+        view = memoryview(encoded)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 @dataclass
 class AgentConfig:
@@ -13,6 +123,11 @@ class AgentConfig:
     provider: Optional[str] = None
     temperature: float = 0.2
     max_tokens: int = 4000
+    # Default step budget per run; orchestrator tasks pass tighter budgets of their own
+    max_steps: int = 20
+    verbosity_level: int = 0
+    # Inference endpoint URLs to spread this agent's calls across (optional)
+    endpoints: List[str] = field(default_factory=list)
     
 @dataclass
 class GitHubConfig:
@@ -39,11 +154,11 @@ class Config:
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration from environment or config file"""
         # Load environment variables
-        dotenv.load_dotenv()
+        load_dotenv_once()
         
         # Set default config path
         if config_path is None:
-            config_path = os.path.join(str(Path.home()), ".code_agent", "config.json")
+            config_path = DEFAULT_CONFIG_PATH
         
         self.config_path = config_path
         self._config = {}
@@ -52,31 +167,46 @@ class Config:
         self._load_from_file()
         
         # Set up GitHub config
+        github = self._config.get("github", {})
         self.github = GitHubConfig(
-            token=os.getenv("GITHUB_TOKEN") or self._config.get("github", {}).get("token", ""),
-            username=os.getenv("GITHUB_USERNAME") or self._config.get("github", {}).get("username", ""),
-            repository=os.getenv("GITHUB_REPOSITORY") or self._config.get("github", {}).get("repository", "")
+            token=os.getenv("GITHUB_TOKEN") or github.get("token", ""),
+            username=os.getenv("GITHUB_USERNAME") or github.get("username", ""),
+            repository=os.getenv("GITHUB_REPOSITORY") or github.get("repository", "")
         )
         
         # Set up default agent configs
-        self.agents = {
-            "architect": AgentConfig(
-                name="architect",
-                model_id=os.getenv("ARCHITECT_MODEL") or self._config.get("agents", {}).get("architect", {}).get("model_id", "meta-llama/Meta-Llama-3.1-70B-Instruct")
-            ),
-            "developer": AgentConfig(
-                name="developer",
-                model_id=os.getenv("DEVELOPER_MODEL") or self._config.get("agents", {}).get("developer", {}).get("model_id", "meta-llama/Meta-Llama-3.1-70B-Instruct")
-            ),
-            "tester": AgentConfig(
-                name="tester",
-                model_id=os.getenv("TESTER_MODEL") or self._config.get("agents", {}).get("tester", {}).get("model_id", "meta-llama/Meta-Llama-3.1-70B-Instruct")
-            ),
-            "reviewer": AgentConfig(
-                name="reviewer",
-                model_id=os.getenv("REVIEWER_MODEL") or self._config.get("agents", {}).get("reviewer", {}).get("model_id", "meta-llama/Meta-Llama-3.1-70B-Instruct")
+        agents = self._config.get("agents", {})
+        self.agents = {}
+        for name, env_var in _AGENT_ENV.items():
+            saved = agents.get(name, {})
+            # Settings missing from the file keep the AgentConfig defaults
+            tuning = {key: saved[key] for key in _AGENT_SETTINGS if saved.get(key) is not None}
+            self.agents[name] = AgentConfig(
+                name=name,
+                model_id=os.getenv(env_var) or saved.get("model_id", _DEFAULT_MODEL_ID),
+                endpoints=list(saved.get("endpoints") or []),
+                **tuning
             )
-        }
+        
+        # Number of feature pipelines build_application runs concurrently
+        self.max_parallel_features = int(
+            os.getenv("MAX_PARALLEL_FEATURES") or self._config.get("max_parallel_features", 4)
+        )
+        
+        # Seconds an orchestrated agent run may take before it is abandoned
+        self.agent_timeout = _positive_float(
+            os.getenv("AGENT_TIMEOUT") or self._config.get("agent_timeout"), DEFAULT_AGENT_TIMEOUT, "agent_timeout"
+        )
+        
+        # Reuse model responses, such as requirements analyses, saved on disk by earlier runs
+        self.enable_response_cache = (
+            os.getenv("ENABLE_RESPONSE_CACHE") or str(self._config.get("enable_response_cache", False))
+        ).lower() in ("1", "true", "yes")
+        
+        # Reuse architect and reviewer results for identical prompts within one process
+        self.enable_prompt_cache = (
+            os.getenv("ENABLE_PROMPT_CACHE") or str(self._config.get("enable_prompt_cache", True))
+        ).lower() in ("1", "true", "yes")
         
         # Current project config
         self.project = None
@@ -85,15 +215,16 @@ class Config:
         """Load configuration from file if it exists"""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    self._config = json.load(f)
+                self._config = read_json_file(self.config_path)
             except json.JSONDecodeError:
                 self._config = {}
     
     def save(self):
         """Save the current configuration to file"""
         # Ensure directory exists
-        os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+        config_dir = os.path.dirname(self.config_path)
+        if config_dir and not os.path.isdir(config_dir):
+            os.makedirs(config_dir, exist_ok=True)
         
         # Prepare config for saving
         config_dict = {
@@ -107,9 +238,16 @@ class Config:
                     "model_id": agent_config.model_id,
                     "provider": agent_config.provider,
                     "temperature": agent_config.temperature,
-                    "max_tokens": agent_config.max_tokens
+                    "max_tokens": agent_config.max_tokens,
+                    "max_steps": agent_config.max_steps,
+                    "verbosity_level": agent_config.verbosity_level,
+                    "endpoints": agent_config.endpoints
                 } for agent_name, agent_config in self.agents.items()
-            }
+            },
+            "max_parallel_features": self.max_parallel_features,
+            "agent_timeout": self.agent_timeout,
+            "enable_response_cache": self.enable_response_cache,
+            "enable_prompt_cache": self.enable_prompt_cache
         }
         
         if self.project:
@@ -121,8 +259,7 @@ class Config:
             }
         
         # Save to file
-        with open(self.config_path, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        write_json_file(self.config_path, config_dict)
     
     def set_project(self, name: str, description: str, root_dir: str):
         """Set the current project configuration"""
@@ -3,10 +3,11 @@ Environment validator script that checks if all prerequisites are met
 before attempting to use any model operations.
 """
 
+import functools
 import os
 import sys
 import logging
-import importlib
+import importlib.util
 import argparse
 
 # Configure logging
@@ -55,22 +56,22 @@ def check_environment():
     logger.info("All required environment variables are set.")
     return True
 
+# Package to install -> module it provides
+REQUIRED_PACKAGES = {
+    "smolagents": "smolagents",
+    "pygithub": "github",
+    "pytest": "pytest",
+    "python-dotenv": "dotenv"
+}
+
 def check_dependencies():
     """Check if all required Python packages are installed"""
-    required_packages = [
-        "smolagents",
-        "pygithub",
-        "pytest",
-        "python-dotenv"
+    # Looked up rather than imported, so nothing's top-level code runs
+    missing_packages = [
+        package for package, module in REQUIRED_PACKAGES.items()
+        if importlib.util.find_spec(module) is None
     ]
     
-    missing_packages = []
-    for package in required_packages:
-        try:
-            importlib.import_module(package)
-        except ImportError:
-            missing_packages.append(package)
-    
     if missing_packages:
         logger.error("Missing required Python packages:")
         for package in missing_packages:
@@ -81,12 +82,16 @@ def check_dependencies():
     logger.info("All required Python packages are installed.")
     return True
 
-def check_config():
+@functools.lru_cache(maxsize=1)
+def _get_config(config_path=None):
+    """Load the configuration once, however many checks use it"""
+    from code_agent.config import Config
+    return Config(config_path)
+
+def check_config(config_path=None):
     """Check if the configuration file is valid"""
     try:
-        from code_agent.config import Config
-        
-        config = Config()
+        config = _get_config(config_path)
         if config.validate():
             logger.info("Configuration is valid.")
             return True
@@ -1,5 +1,4 @@
 import os
-import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -7,6 +6,9 @@ from .config import Config
 from .agents.orchestrator import AgentOrchestrator
 from .utils.logger import logger
 
+# Context handed to the developer when a feature is requested on its own
+_EXPLORE_CONTEXT = "Use the filesystem tools to explore the project structure."
+
 class CodeAgentApp:
     """Main Code Agent application class"""
     
@@ -19,6 +21,8 @@ class CodeAgentApp:
         """
         self.config = Config(config_path)
         self.orchestrator = None
+        # Project directory the orchestrator currently points at
+        self._current_path: Optional[str] = None
         
         # Validate configuration during initialization
         if not self.config.validate():
@@ -84,9 +88,10 @@ class CodeAgentApp:
         # Initialize orchestrator if not already initialized
         if self.orchestrator is None:
             self.orchestrator = AgentOrchestrator(self.config, root_dir)
-        else:
+        elif root_dir != self._current_path:
             # Update project path in orchestrator
             self.orchestrator.set_project_path(root_dir)
+        self._current_path = root_dir
         
         logger.info(f"Project set to '{name}' at '{root_dir}'")
     
@@ -113,12 +118,11 @@ class CodeAgentApp:
             Build results
         """
         # Use provided output directory or create one based on project name in the projects directory
-        if not output_dir:
-            projects_dir = os.path.join(os.getcwd(), "projects")
-            output_dir = os.path.join(projects_dir, project_name)
+        out = Path(output_dir or Path.cwd() / "projects" / project_name).resolve()
         
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        out.mkdir(parents=True, exist_ok=True)
+        output_dir = str(out)
         
         # Set project
         self.set_project(project_name, requirements, output_dir)
@@ -148,7 +152,7 @@ class CodeAgentApp:
         result = self.orchestrator.implement_feature(
             feature_name, 
             feature_description, 
-            "Use the filesystem tools to explore the project structure."
+            _EXPLORE_CONTEXT
         )
         
         logger.info(f"Feature '{feature_name}' implemented successfully")
@@ -212,7 +216,7 @@ class CodeAgentApp:
         self._ensure_project_set()
         
         # Process the request with the manager agent
-        result = self.orchestrator.agents["manager"].run(request)
+        result = self.orchestrator.run_manager(request)
         
         logger.info("Request processed successfully")
         
@@ -3,5 +3,6 @@ Model management module for the Code Agent application.
 """
 
 from .model_manager import ModelManager
+from .multi_endpoint import MultiEndpointModel
 
-__all__ = ['ModelManager'] 
+__all__ = ['ModelManager', 'MultiEndpointModel'] 
@@ -2,11 +2,100 @@
 Model manager for the Code Agent application.
 """
 
-from typing import Dict, Any, Optional
-from smolagents import HfApiModel
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Union, TYPE_CHECKING
 import os
 from pathlib import Path
-import dotenv
+
+from ..config import load_dotenv_once
+from .multi_endpoint import MultiEndpointModel
+
+if TYPE_CHECKING:
+    from smolagents import HfApiModel
+
+# Connection pool shared by every Hugging Face API call in the process
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+# 429 is left out on purpose: rate limits must reach MultiEndpointModel so it can
+# move the call to another endpoint instead of waiting out retries on this one
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+
+_http_pool_configured = False
+
+def configure_http_pool() -> None:
+    """
+    Route huggingface_hub requests through one pooled, retrying session
+
+    Without this each call may open a fresh TLS connection. Safe to call repeatedly.
+    """
+    global _http_pool_configured
+    if _http_pool_configured:
+        return
+
+    try:
+        import requests
+        from huggingface_hub import configure_http_backend
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        # Older huggingface_hub versions manage their own sessions
+        return
+
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        # Inference calls are POSTs, which Retry skips unless told otherwise
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=None
+        )
+    )
+
+    def backend_factory() -> "requests.Session":
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    configure_http_backend(backend_factory=backend_factory)
+    _http_pool_configured = True
+
+@lru_cache(maxsize=None)
+def _build_model(model_id: str, provider: Optional[str], temperature: float, max_tokens: int,
+                 endpoints: Tuple[str, ...], tokens: Tuple[str, ...]) -> Union["HfApiModel", MultiEndpointModel]:
+    """
+    Create a model instance, shared process-wide by every caller with the same configuration
+
+    Args:
+        model_id: The model identifier
+        provider: Optional provider name
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        endpoints: Endpoint URLs to load-balance across, or empty
+        tokens: API tokens; a single token unless endpoints are given
+
+    Returns:
+        HfApiModel instance, or MultiEndpointModel when endpoints are given
+    """
+    if endpoints:
+        return MultiEndpointModel.from_endpoints(
+            list(endpoints),
+            list(tokens),
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+
+    from smolagents import HfApiModel
+    
+    return HfApiModel(
+        model_id=model_id,
+        provider=provider,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        token=tokens[0]
+    )
 
 class ModelManager:
     """
@@ -16,16 +105,21 @@ class ModelManager:
     def __init__(self):
         """Initialize the model manager and load API tokens."""
         # Load environment variables
-        dotenv.load_dotenv()
+        load_dotenv_once()
+        
+        # Share keep-alive connections across all model calls
+        configure_http_pool()
         
         # Get API tokens from environment
         self.hf_token = os.getenv("HF_TOKEN", "")
         
-        # Initialize model instances
-        self._models = {}
+        # Optional extra tokens, comma separated, for spreading load across endpoints
+        self.hf_tokens = [t for t in os.getenv("HF_TOKENS", "").split(",") if t] or [self.hf_token]
+
     
     def get_model(self, model_id: str, provider: Optional[str] = None, 
-                 temperature: float = 0.2, max_tokens: int = 4000) -> HfApiModel:
+                 temperature: float = 0.2, max_tokens: int = 4000,
+                 endpoints: Optional[List[str]] = None) -> Union["HfApiModel", MultiEndpointModel]:
         """
         Get or create a model instance.
         
@@ -34,30 +128,19 @@ class ModelManager:
             provider: Optional provider name
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            endpoints: Endpoint URLs serving the model, load-balanced round-robin (optional)
             
         Returns:
-            HfApiModel instance
+            HfApiModel instance, or MultiEndpointModel when endpoints are given
         """
-        # Create a unique key for this model configuration
-        key = f"{model_id}_{provider}_{temperature}_{max_tokens}"
-        
-        # Return existing model if available
-        if key in self._models:
-            return self._models[key]
-        
-        # Create a new model instance
-        model = HfApiModel(
-            model_id=model_id,
-            provider=provider,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            token=self.hf_token
+        return _build_model(
+            model_id,
+            provider,
+            temperature,
+            max_tokens,
+            tuple(endpoints or ()),
+            tuple(self.hf_tokens) if endpoints else (self.hf_token,)
         )
-        
-        # Cache the model instance
-        self._models[key] = model
-        
-        return model
     
     def list_available_models(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,137 @@
+"""
+Round-robin model that spreads calls across several inference endpoints.
+"""
+
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, TYPE_CHECKING
+
+from ..utils.logger import logger
+
+if TYPE_CHECKING:
+    from smolagents import HfApiModel
+
+# Default number of calls allowed in flight against a single endpoint
+DEFAULT_MAX_CONCURRENCY_PER_ENDPOINT = 4
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check whether an error is an HTTP 429 from the inference endpoint"""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+class MultiEndpointModel:
+    """
+    Drop-in replacement for HfApiModel that load-balances across endpoints
+
+    Calls are dispatched round-robin, bounded per endpoint, and retried on the
+    next endpoint when one is rate limited. Within pin(), every call from the
+    current thread goes to the same endpoint so its prompt prefix cache is reused.
+    """
+
+    def __init__(self, models: List["HfApiModel"],
+                 max_concurrency_per_endpoint: int = DEFAULT_MAX_CONCURRENCY_PER_ENDPOINT):
+        """
+        Initialize the multi-endpoint model
+
+        Args:
+            models: One model per endpoint
+            max_concurrency_per_endpoint: Maximum number of calls in flight per endpoint
+        """
+        if not models:
+            raise ValueError("At least one model endpoint is required")
+
+        self.models = list(models)
+        self._cycle = itertools.cycle(self.models)
+        self._cycle_lock = threading.Lock()
+        self._semaphores = {
+            id(model): threading.BoundedSemaphore(max_concurrency_per_endpoint)
+            for model in self.models
+        }
+        self._local = threading.local()
+
+    @classmethod
+    def from_endpoints(cls, endpoints: List[str], api_keys: List[str], **model_kwargs) -> "MultiEndpointModel":
+        """
+        Build a multi-endpoint model from endpoint URLs or model IDs
+
+        Args:
+            endpoints: Endpoint URLs or model IDs
+            api_keys: API keys, assigned to endpoints round-robin
+            **model_kwargs: Extra HfApiModel arguments, e.g. temperature
+
+        Returns:
+            MultiEndpointModel instance
+        """
+        from smolagents import HfApiModel
+        
+        if not api_keys:
+            api_keys = [None]
+        models = [
+            HfApiModel(model_id=endpoint, token=api_keys[i % len(api_keys)], **model_kwargs)
+            for i, endpoint in enumerate(endpoints)
+        ]
+        return cls(models)
+
+    def pick(self) -> "HfApiModel":
+        """
+        Get the model for the next call
+
+        Returns:
+            The pinned model for this thread, or the next model in rotation
+        """
+        pinned = getattr(self._local, "model", None)
+        if pinned is not None:
+            return pinned
+        with self._cycle_lock:
+            return next(self._cycle)
+
+    @contextmanager
+    def pin(self) -> Iterator["HfApiModel"]:
+        """
+        Route all calls from the current thread to one endpoint
+
+        Nested pins keep the outermost endpoint.
+
+        Yields:
+            The pinned model
+        """
+        if getattr(self._local, "model", None) is not None:
+            yield self._local.model
+            return
+
+        self._local.model = self.pick()
+        try:
+            yield self._local.model
+        finally:
+            self._local.model = None
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._dispatch("__call__", args, kwargs)
+
+    def generate(self, *args, **kwargs) -> Any:
+        return self._dispatch("generate", args, kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Attributes such as model_id or token counts come from the first endpoint
+        if name == "models":
+            raise AttributeError(name)
+        return getattr(self.models[0], name)
+
+    def _dispatch(self, method: str, args: tuple, kwargs: dict) -> Any:
+        """Call a model method, moving to the next endpoint on rate limiting"""
+        start = self.models.index(self.pick())
+        last_error: Optional[Exception] = None
+
+        for offset in range(len(self.models)):
+            model = self.models[(start + offset) % len(self.models)]
+            with self._semaphores[id(model)]:
+                try:
+                    return getattr(model, method)(*args, **kwargs)
+                except Exception as e:
+                    if not _is_rate_limited(e):
+                        raise
+                    last_error = e
+            logger.warning(f"Endpoint {model.model_id} is rate limited; retrying on the next endpoint")
+
+        raise last_error
@@ -9,7 +9,7 @@ import sys
 import unittest
 import argparse
 import logging
-import importlib
+import importlib.util
 
 # Configure logging
 logging.basicConfig(
@@ -42,22 +42,22 @@ def check_environment():
     
     return True
 
+# Package to install -> module it provides
+REQUIRED_PACKAGES = {
+    "smolagents": "smolagents",
+    "pygithub": "github",
+    "pytest": "pytest",
+    "python-dotenv": "dotenv"
+}
+
 def check_dependencies():
     """Check if all required Python packages are installed"""
-    required_packages = [
-        "smolagents",
-        "pygithub",
-        "pytest",
-        "python-dotenv"
+    # Looked up rather than imported, so nothing's top-level code runs
+    missing_packages = [
+        package for package, module in REQUIRED_PACKAGES.items()
+        if importlib.util.find_spec(module) is None
     ]
     
-    missing_packages = []
-    for package in required_packages:
-        try:
-            importlib.import_module(package)
-        except ImportError:
-            missing_packages.append(package)
-    
     if missing_packages:
         logger.warning("Missing Python packages:")
         for package in missing_packages:
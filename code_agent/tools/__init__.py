@@ -9,6 +9,8 @@ from .filesystem_tools import (
     read_file, 
     create_directory,
     write_file,
+    read_files,
+    write_files,
     init_project
 )
 
@@ -25,6 +27,7 @@ from .test_tools import (
     set_project_path as set_test_project_path,
     generate_test,
     run_tests,
+    run_tests_batch,
     run_coverage
 )
 
@@ -51,6 +54,8 @@ __all__ = [
     'read_file',
     'create_directory',
     'write_file',
+    'read_files',
+    'write_files',
     'analyze_code',
     'format_code',
     'fix_code',
@@ -60,5 +65,6 @@ __all__ = [
     'validate_python_code',
     'generate_test',
     'run_tests',
+    'run_tests_batch',
     'run_coverage'
 ]
\ No newline at end of file
@@ -12,15 +12,15 @@ import json
 # Module-level variable for project path
 _project_path = None
 
-def set_project_path(path: str) -> None:
+def set_project_path(path: Union[str, os.PathLike]) -> None:
     """
     Set the project path
     
     Args:
-        path: New project path
+        path: New project path, used as given without being resolved again
     """
     global _project_path
-    _project_path = path
+    _project_path = os.fspath(path)
 
 @tool
 def analyze_code(code: str) -> Dict[str, Any]:
@@ -8,15 +8,15 @@ import json
 # Module-level variable for base path
 _base_path = None
 
-def set_base_path(path: str) -> None:
+def set_base_path(path: Union[str, os.PathLike]) -> None:
     """
     Set the base path for filesystem operations
     
     Args:
-        path: New base path
+        path: New base path, used as given without being resolved again
     """
     global _base_path
-    _base_path = path
+    _base_path = os.fspath(path)
 
 def _resolve_path(path: str) -> str:
     """
@@ -193,6 +193,69 @@ def write_file(path: str, content: str) -> Dict[str, str]:
             "status": "error",
             "message": f"Failed to write file {path}: {str(e)}"
         }
+
+@tool
+def write_files(files: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Write several files in one call
+    
+    Args:
+        files: Mapping of file path (relative to base path) to content
+        
+    Returns:
+        Dictionary with the paths written and any per-file errors
+    """
+    written = []
+    errors = {}
+    created_dirs = set()
+    
+    for path, content in files.items():
+        full_path = _resolve_path(path)
+        try:
+            # Create each parent directory once, however many files go in it
+            parent = os.path.dirname(full_path)
+            if parent not in created_dirs:
+                os.makedirs(parent, exist_ok=True)
+                created_dirs.add(parent)
+            
+            file_obj = open(full_path, 'w', encoding='utf-8')
+            file_obj.write(content)
+            file_obj.close()
+            written.append(path)
+        except Exception as e:
+            errors[path] = f"Failed to write file {path}: {str(e)}"
+    
+    return {
+        "status": "error" if errors else "success",
+        "written": written,
+        "errors": errors
+    }
+
+@tool
+def read_files(paths: List[str]) -> Dict[str, Any]:
+    """
+    Read several files in one call
+    
+    Args:
+        paths: File paths (relative to base path)
+        
+    Returns:
+        Dictionary mapping each path to its content, or to an error message
+    """
+    contents = {}
+    
+    for path in paths:
+        full_path = _resolve_path(normalize_path(path))
+        try:
+            file_obj = open(full_path, 'r', encoding='utf-8')
+            contents[path] = file_obj.read()
+            file_obj.close()
+        except UnicodeDecodeError:
+            contents[path] = f"Error: cannot read binary file: {path}"
+        except Exception as e:
+            contents[path] = f"Error: failed to read file: {str(e)}"
+    
+    return contents
         
 @tool
 def init_project(project_dir: str, project_name: str) -> Dict[str, Any]:
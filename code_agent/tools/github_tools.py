@@ -1,13 +1,29 @@
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from github import Github, GithubException
 import os
 import subprocess
-from pathlib import Path
+
+from ..config import DEFAULT_CONFIG_PATH
+
+# Keep-alive connections kept open to the GitHub API per token
+GITHUB_POOL_SIZE = 8
+
+@lru_cache(maxsize=None)
+def _shared_client(token: str) -> Github:
+    """
+    Get the GitHub client for a token, shared process-wide
+    
+    Each client holds its own connection pool, so sharing one avoids a fresh
+    TLS handshake for every GitHubTools instance.
+    """
+    return Github(token, pool_size=GITHUB_POOL_SIZE)
 
 class GitHubTools:
     """Enhanced GitHub tools with repository creation capabilities"""
     
-    def __init__(self, token: str, username: str, repository: Optional[str] = None):
+    def __init__(self, token: str, username: str, repository: Optional[str] = None,
+                 github: Optional[Github] = None):
         """
         Initialize GitHub tools
         
@@ -15,11 +31,12 @@ class GitHubTools:
             token: GitHub API token
             username: GitHub username
             repository: GitHub repository name (optional)
+            github: Client to use instead of the shared one for the token (optional)
         """
         self.token = token
         self.username = username
         self.repository = repository
-        self.github = Github(token)
+        self.github = github or _shared_client(token)
         self.repo = None
         self.local_repo_path = None
         
@@ -76,7 +93,7 @@ class GitHubTools:
             
             # Save repository to config
             try:
-                config_path = os.path.join(str(Path.home()), ".code_agent", "config.json")
+                config_path = DEFAULT_CONFIG_PATH
                 if os.path.exists(config_path):
                     with open(config_path, 'r') as f:
                         config = json.load(f)
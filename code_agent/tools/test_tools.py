@@ -13,15 +13,15 @@ import re
 # Module-level variable for project path
 _project_path = None
 
-def set_project_path(path: str) -> None:
+def set_project_path(path: Union[str, os.PathLike]) -> None:
     """
     Set the project path
     
     Args:
-        path: New project path
+        path: New project path, used as given without being resolved again
     """
     global _project_path
-    _project_path = path
+    _project_path = os.fspath(path)
 
 def _resolve_path(path: str) -> str:
     """
@@ -234,6 +234,98 @@ def run_tests(test_path: str, verbose: bool = True) -> Dict[str, Any]:
             "error": f"Failed to run tests: {str(e)}"
         }
 
+# Outcome words pytest -v prints after each test's node ID
+_VERBOSE_RESULT = re.compile(r'^(\S+?)::\S+ (PASSED|FAILED|SKIPPED|ERROR|XFAIL|XPASS)\b')
+_OUTCOME_KEYS = {
+    "PASSED": "passed",
+    "XPASS": "passed",
+    "FAILED": "failed",
+    "ERROR": "failed",
+    "SKIPPED": "skipped",
+    "XFAIL": "skipped"
+}
+
+# Short summary line for a test file that could not be collected
+_COLLECTION_ERROR = re.compile(r'^ERROR ([^\s:]+)(?: - .*)?$')
+
+@tool
+def run_tests_batch(test_paths: List[str]) -> Dict[str, Any]:
+    """
+    Run pytest once over several test files or directories
+    
+    Args:
+        test_paths: Paths to test files or directories
+        
+    Returns:
+        Overall test results, plus results per requested path under "per_path"
+    """
+    root = _project_path or os.getcwd()
+    full_paths = {path: os.path.normpath(_resolve_path(path)) for path in test_paths}
+    missing = [path for path, full_path in full_paths.items() if not os.path.exists(full_path)]
+    if missing:
+        return {
+            "status": "error",
+            "error": f"Test paths not found: {', '.join(missing)}"
+        }
+    
+    try:
+        # One process collects everything; node IDs come back relative to the root.
+        # A file that fails to import must not stop the other files from running.
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "-v", "--continue-on-collection-errors", "--rootdir", root]
+            + list(full_paths.values()),
+            capture_output=True,
+            text=True,
+            cwd=root
+        )
+        
+        per_path = {
+            path: {"passed": 0, "failed": 0, "skipped": 0}
+            for path in test_paths
+        }
+        for line in result.stdout.split('\n'):
+            match = _VERBOSE_RESULT.match(line)
+            if match:
+                test_file, outcome = match.group(1), _OUTCOME_KEYS[match.group(2)]
+            else:
+                match = _COLLECTION_ERROR.match(line)
+                if not match:
+                    continue
+                test_file, outcome = match.group(1), "failed"
+            test_file = os.path.normpath(os.path.join(root, test_file))
+            for path, full_path in full_paths.items():
+                if test_file == full_path or test_file.startswith(full_path + os.sep):
+                    per_path[path][outcome] += 1
+                    break
+        
+        results = {}
+        for path, counts in per_path.items():
+            counts["total"] = counts["passed"] + counts["failed"] + counts["skipped"]
+            results[path] = {
+                "status": "failure" if counts["failed"] else "success",
+                "summary": counts
+            }
+        
+        summary = {
+            key: sum(r["summary"][key] for r in results.values())
+            for key in ("passed", "failed", "skipped", "total")
+        }
+        
+        return {
+            "exit_code": result.returncode,
+            "status": "success" if result.returncode == 0 else "failure",
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+            "summary": summary,
+            "per_path": results
+        }
+        
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": f"Failed to run tests: {str(e)}"
+        }
+
 @tool
 def run_coverage(test_path: str, source_path: Optional[str] = None) -> Dict[str, Any]:
     """
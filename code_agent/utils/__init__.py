@@ -13,6 +13,8 @@ from .helpers import (
     extract_features_from_requirements
 )
 from .project_utils import initialize_project_structure
+from .response_cache import ResponseCache
+from .template_cache import TemplateCache
 
 __all__ = [
     'logger',
@@ -24,5 +26,7 @@ __all__ = [
     'run_command',
     'get_current_branch',
     'extract_features_from_requirements',
-    'initialize_project_structure'
+    'initialize_project_structure',
+    'ResponseCache',
+    'TemplateCache'
 ] 
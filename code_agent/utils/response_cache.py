@@ -0,0 +1,306 @@
+"""
+Response cache for agent runs.
+
+Two-tier lookup: an exact match on the SHA-256 of the prompt stored in SQLite,
+then (when sentence-transformers and faiss are installed) a semantic match on
+prompt embeddings so near-identical prompts reuse a previous response.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .logger import logger
+
+DEFAULT_CACHE_PATH = os.path.join(str(Path.home()), ".cache", "code_agent", "responses.sqlite3")
+DEFAULT_TTL = 7 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_DISTANCE = 0.05
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Access-time updates from hits are held back and written together in one commit
+TOUCH_FLUSH_SIZE = 32
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    response TEXT NOT NULL,
+    embedding BLOB,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+@lru_cache(maxsize=4)
+def _shared_encoder(model_name: str) -> Any:
+    """Load a sentence-transformers model once per process"""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+@lru_cache(maxsize=1)
+def get_default_cache() -> Optional["ResponseCache"]:
+    """
+    Get the process-wide cache enabled by CODE_AGENT_CACHE
+
+    CODE_AGENT_CACHE=1 enables exact matches only; CODE_AGENT_CACHE=semantic
+    also enables the embedding tier, which needs sentence-transformers and faiss.
+
+    Returns:
+        Shared ResponseCache at the default path, or None when the variable is unset
+    """
+    mode = (os.getenv("CODE_AGENT_CACHE") or "").lower()
+    if mode not in ("1", "semantic"):
+        return None
+    return ResponseCache(DEFAULT_CACHE_PATH, semantic=mode == "semantic")
+
+class ResponseCache:
+    """Persistent prompt -> response cache with TTL and LRU eviction"""
+
+    def __init__(self,
+                 path: str = DEFAULT_CACHE_PATH,
+                 ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 semantic: bool = True,
+                 max_distance: float = DEFAULT_MAX_DISTANCE,
+                 embedding_model: str = DEFAULT_EMBEDDING_MODEL):
+        """
+        Initialize the response cache
+
+        Args:
+            path: Path to the SQLite database file
+            ttl: Seconds before an entry expires
+            max_entries: Maximum number of entries kept before evicting least recently used
+            semantic: Whether to enable the embedding-based lookup tier
+            max_distance: Maximum cosine distance for a semantic hit
+            embedding_model: sentence-transformers model used to embed prompts
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.semantic = semantic
+        self.max_distance = max_distance
+        self.embedding_model = embedding_model
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL lets readers proceed during writes and, with NORMAL sync, skips an fsync per commit
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        
+        # key -> accessed_at for hits not yet written back
+        self._touched: Dict[str, float] = {}
+
+        # Semantic tier state, built lazily on first use
+        self._encoder = None
+        self._indexes: Dict[str, Tuple[Any, List[str]]] = {}
+
+    @staticmethod
+    def make_key(namespace: str, prompt: str) -> str:
+        """
+        Compute the exact-match key for a prompt
+
+        Args:
+            namespace: Cache namespace, e.g. the agent name
+            prompt: Prompt text
+
+        Returns:
+            Hex digest identifying the prompt within the namespace
+        """
+        return hashlib.sha256(f"{namespace}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, namespace: str, prompt: str) -> Optional[Any]:
+        """
+        Look up a cached response
+
+        Args:
+            namespace: Cache namespace, e.g. the agent name
+            prompt: Prompt text
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        key = self.make_key(namespace, prompt)
+        response = self._get_by_key(key)
+        if response is not None:
+            return response
+
+        if not self.semantic:
+            return None
+
+        key = self._nearest_key(namespace, prompt)
+        if key is None:
+            return None
+        return self._get_by_key(key)
+
+    def put(self, namespace: str, prompt: str, response: Any) -> None:
+        """
+        Store a response
+
+        Args:
+            namespace: Cache namespace, e.g. the agent name
+            prompt: Prompt text
+            response: JSON-serializable response; other values are not cached
+        """
+        try:
+            payload = json.dumps(response)
+        except (TypeError, ValueError):
+            logger.debug(f"Response for {namespace} is not JSON-serializable; not caching")
+            return
+
+        embedding = self._embed(prompt) if self.semantic else None
+        key = self.make_key(namespace, prompt)
+        now = time.time()
+
+        with self._lock:
+            self._flush_touched()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, payload, embedding.tobytes() if embedding is not None else None, now, now)
+            )
+            evicted = self._evict()
+            self._conn.commit()
+            if evicted:
+                # Evicted keys may belong to any namespace
+                self._indexes.clear()
+            elif embedding is not None and namespace in self._indexes:
+                # Extend the built index instead of rebuilding it on next lookup
+                index, keys = self._indexes[namespace]
+                index.add(embedding.reshape(1, -1))
+                keys.append(key)
+
+    def warm_up(self) -> None:
+        """Load the embedding model and build the semantic indexes ahead of the first lookup"""
+        if not self.semantic or self._load_encoder() is None:
+            return
+        with self._lock:
+            namespaces = [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT namespace FROM cache WHERE embedding IS NOT NULL"
+            )]
+        for namespace in namespaces:
+            self._get_index(namespace)
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+            self._indexes.clear()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+            self._conn.close()
+
+    def _get_by_key(self, key: str) -> Optional[Any]:
+        """Fetch a live entry by key, dropping it if expired"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT namespace, response, created_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            namespace, payload, created_at = row
+            if now - created_at > self.ttl:
+                self._touched.pop(key, None)
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._indexes.pop(namespace, None)
+                return None
+
+            self._touched[key] = now
+            if len(self._touched) >= TOUCH_FLUSH_SIZE:
+                self._flush_touched()
+                self._conn.commit()
+
+        return json.loads(payload)
+
+    def _flush_touched(self) -> None:
+        """Write pending access times in one statement; the caller commits"""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict(self) -> int:
+        """Drop expired entries and the least recently used ones beyond max_entries, returning the count"""
+        expired = self._conn.execute("DELETE FROM cache WHERE created_at < ?", (time.time() - self.ttl,))
+        overflow = self._conn.execute(
+            "DELETE FROM cache WHERE key IN "
+            "(SELECT key FROM cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        return expired.rowcount + overflow.rowcount
+
+    def _load_encoder(self) -> Any:
+        """Load the sentence-transformers encoder, disabling the semantic tier if unavailable"""
+        if self._encoder is None:
+            try:
+                import faiss  # noqa: F401
+                import sentence_transformers  # noqa: F401
+            except ImportError:
+                logger.info("sentence-transformers/faiss not installed; semantic response cache disabled")
+                self.semantic = False
+                return None
+            self._encoder = _shared_encoder(self.embedding_model)
+        return self._encoder
+
+    def _embed(self, prompt: str) -> Any:
+        """Embed a prompt as a unit-length float32 vector"""
+        encoder = self._load_encoder()
+        if encoder is None:
+            return None
+        return encoder.encode([prompt], normalize_embeddings=True)[0].astype("float32")
+
+    def _nearest_key(self, namespace: str, prompt: str) -> Optional[str]:
+        """Find the key of the closest cached prompt within max_distance"""
+        embedding = self._embed(prompt)
+        if embedding is None:
+            return None
+
+        index, keys = self._get_index(namespace)
+
+        if not keys:
+            return None
+
+        # Vectors are normalized, so inner product is cosine similarity
+        similarities, positions = index.search(embedding.reshape(1, -1), 1)
+        if 1.0 - float(similarities[0][0]) > self.max_distance:
+            return None
+        return keys[int(positions[0][0])]
+
+    def _get_index(self, namespace: str) -> Tuple[Any, List[str]]:
+        """Get the FAISS index and row keys for a namespace, building it from the table if needed"""
+        import faiss
+        import numpy as np
+
+        with self._lock:
+            if namespace not in self._indexes:
+                rows = self._conn.execute(
+                    "SELECT key, embedding FROM cache WHERE namespace = ? AND embedding IS NOT NULL",
+                    (namespace,)
+                ).fetchall()
+                dimension = self._encoder.get_sentence_embedding_dimension()
+                index = faiss.IndexFlatIP(dimension)
+                if rows:
+                    index.add(np.stack([np.frombuffer(blob, dtype="float32") for _, blob in rows]))
+                self._indexes[namespace] = (index, [key for key, _ in rows])
+            return self._indexes[namespace]
@@ -0,0 +1,298 @@
+"""
+Template cache for requirements analyses.
+
+Requirements that differ only in their stack ("... with FastAPI and
+PostgreSQL" versus "... with Flask and MySQL") tend to get the same plan back
+from the architect. Instead of caching verbatim prompts, this cache stores each
+analysis as a parameterized template keyed by a fingerprint of the requirements
+with their slot values (language, framework, datastore) abstracted away, and
+fills the template with the slot values of a new request on a hit.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .logger import logger
+
+DEFAULT_TEMPLATE_CACHE_PATH = os.path.join(str(Path.home()), ".cache", "code_agent", "templates.sqlite3")
+DEFAULT_TTL = 30 * 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 200
+
+# slot -> [(value, category, pattern)]. Values sharing a category are
+# interchangeable in a template; the category is part of the fingerprint.
+SLOT_VALUES: Dict[str, List[Tuple[str, str, str]]] = {
+    "language": [
+        ("Python", "python", r"\bpython\b"),
+        ("JavaScript", "javascript", r"\bjavascript\b"),
+        ("TypeScript", "typescript", r"\btypescript\b"),
+        ("Java", "java", r"\bjava\b"),
+        ("Rust", "rust", r"\brust\b"),
+    ],
+    "framework": [
+        ("FastAPI", "python-web", r"\bfastapi\b"),
+        ("Flask", "python-web", r"\bflask\b"),
+        ("Django", "python-web", r"\bdjango\b"),
+        ("Express", "node-web", r"\bexpress(?:\.js)?\b"),
+        ("React", "frontend", r"\breact(?:\.js)?\b"),
+        ("Vue", "frontend", r"\bvue(?:\.js)?\b"),
+    ],
+    "datastore": [
+        ("PostgreSQL", "sql", r"\bpostgres(?:ql)?\b"),
+        ("MySQL", "sql", r"\bmysql\b"),
+        ("SQLite", "sql", r"\bsqlite\b"),
+        ("MongoDB", "document", r"\bmongo(?:db)?\b"),
+        ("Redis", "key-value", r"\bredis\b"),
+    ],
+}
+
+# Feature keywords that change the shape of a plan
+FEATURE_KEYWORDS: Dict[str, str] = {
+    "auth": r"\b(?:auth\w*|log ?in|sign ?up|oauth)\b",
+    "api": r"\b(?:api|rest|endpoints?|graphql)\b",
+    "ui": r"\b(?:ui|frontend|web page|dashboard)\b",
+    "cli": r"\b(?:cli|command[- ]line)\b",
+    "realtime": r"\b(?:websockets?|real[- ]time)\b",
+    "payments": r"\b(?:payments?|billing|stripe)\b",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS templates (
+    fingerprint TEXT PRIMARY KEY,
+    template TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+def extract_slots(text: str) -> Optional[Dict[str, Tuple[str, str]]]:
+    """
+    Extract slot values from free text
+
+    Args:
+        text: Requirements or response text
+
+    Returns:
+        Mapping of slot name to (value, category), or None if a slot is ambiguous
+    """
+    slots = {}
+    for slot, values in SLOT_VALUES.items():
+        found = [(value, category) for value, category, pattern in values
+                 if re.search(pattern, text, re.IGNORECASE)]
+        if len(found) > 1:
+            return None
+        if found:
+            slots[slot] = found[0]
+    return slots
+
+def _normalize(requirements: str) -> str:
+    """Lowercase and collapse whitespace, with each slot value replaced by its slot name"""
+    text = " ".join(requirements.lower().split())
+    for slot, values in SLOT_VALUES.items():
+        for _, _, pattern in values:
+            text = re.sub(pattern, "{{" + slot + "}}", text, flags=re.IGNORECASE)
+    return text
+
+def fingerprint(requirements: str) -> Optional[str]:
+    """
+    Compute the fingerprint of a set of requirements
+
+    Args:
+        requirements: Requirements text
+
+    Returns:
+        Hex digest of the slot categories, feature keywords and normalized
+        requirement text, or None if the requirements have no recognizable slots
+    """
+    slots = extract_slots(requirements)
+    if not slots:
+        return None
+
+    shape = {
+        "slots": {slot: category for slot, (_, category) in slots.items()},
+        "features": sorted(name for name, pattern in FEATURE_KEYWORDS.items()
+                           if re.search(pattern, requirements, re.IGNORECASE)),
+        # Only requirements that say the same thing apart from the stack share a plan
+        "text": hashlib.sha256(_normalize(requirements).encode("utf-8")).hexdigest(),
+    }
+    return hashlib.sha256(json.dumps(shape, sort_keys=True).encode("utf-8")).hexdigest()
+
+def _parameterize(value: Any, patterns: Dict[str, str]) -> Any:
+    """Replace JSON string values that are exactly a slot value with that slot's placeholder"""
+    if isinstance(value, str):
+        for slot, pattern in patterns.items():
+            if re.fullmatch(pattern, value.strip(), re.IGNORECASE):
+                return "{{" + slot + "}}"
+        return value
+    if isinstance(value, list):
+        return [_parameterize(item, patterns) for item in value]
+    if isinstance(value, dict):
+        return {key: _parameterize(item, patterns) for key, item in value.items()}
+    return value
+
+class TemplateCache:
+    """Persistent fingerprint -> response template cache with validation on reuse"""
+
+    def __init__(self,
+                 path: str = DEFAULT_TEMPLATE_CACHE_PATH,
+                 ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the template cache
+
+        Args:
+            path: Path to the SQLite database file
+            ttl: Seconds before a template expires
+            max_entries: Maximum number of templates kept before evicting least recently used
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, requirements: str) -> Optional[Any]:
+        """
+        Instantiate the cached template matching the requirements
+
+        Args:
+            requirements: Requirements text
+
+        Returns:
+            Response with the requirements' slot values filled in, or None on a
+            miss or when the instantiated template fails validation
+        """
+        key = fingerprint(requirements)
+        if key is None:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT template, created_at FROM templates WHERE fingerprint = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            template, created_at = row
+            if now - created_at > self.ttl:
+                self._delete(key)
+                return None
+
+        response = self._instantiate(template, extract_slots(requirements))
+        if response is None:
+            logger.debug("Cached plan template failed validation; evicting")
+            with self._lock:
+                self._delete(key)
+            return None
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE templates SET hits = hits + 1, accessed_at = ? WHERE fingerprint = ?", (now, key)
+            )
+            self._conn.commit()
+        return response
+
+    def put(self, requirements: str, response: Any) -> None:
+        """
+        Store a response as a template for requirements of the same shape
+
+        Args:
+            requirements: Requirements text the response was produced for
+            response: JSON-serializable response; other values are not cached
+        """
+        key = fingerprint(requirements)
+        if key is None:
+            return
+
+        # Substituting inside longer strings would rewrite unrelated tokens
+        # such as "python-dotenv", so only whole values become placeholders
+        patterns = {
+            slot: next(p for v, _, p in SLOT_VALUES[slot] if v == value)
+            for slot, (value, _) in extract_slots(requirements).items()
+        }
+        try:
+            template = json.dumps(_parameterize(response, patterns))
+        except (TypeError, ValueError):
+            logger.debug("Plan is not JSON-serializable; not caching as a template")
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO templates VALUES (?, ?, 0, ?, ?)", (key, template, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def invalidate(self, requirements: str) -> None:
+        """
+        Drop the template for requirements, e.g. after a reused plan was rejected
+
+        Args:
+            requirements: Requirements text
+        """
+        key = fingerprint(requirements)
+        if key is not None:
+            with self._lock:
+                self._delete(key)
+
+    def clear(self) -> None:
+        """Remove all templates"""
+        with self._lock:
+            self._conn.execute("DELETE FROM templates")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _instantiate(self, template: str, slots: Dict[str, Tuple[str, str]]) -> Optional[Any]:
+        """Fill a template with slot values, returning None if the result is invalid"""
+        text = template
+        for slot, (value, _) in slots.items():
+            text = text.replace("{{" + slot + "}}", value)
+
+        # Every placeholder must be filled
+        if "{{" in text and re.search(r"\{\{\w+\}\}", text):
+            return None
+
+        # No other value of a filled slot may survive, e.g. a stray "FastAPI"
+        # in a plan instantiated for Flask
+        for slot, (value, _) in slots.items():
+            for other, _, pattern in SLOT_VALUES[slot]:
+                if other != value and re.search(pattern, text, re.IGNORECASE):
+                    return None
+
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
+
+    def _delete(self, key: str) -> None:
+        """Delete a template by fingerprint"""
+        self._conn.execute("DELETE FROM templates WHERE fingerprint = ?", (key,))
+        self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop expired templates and the least recently used ones beyond max_entries"""
+        self._conn.execute("DELETE FROM templates WHERE created_at < ?", (time.time() - self.ttl,))
+        self._conn.execute(
+            "DELETE FROM templates WHERE fingerprint IN "
+            "(SELECT fingerprint FROM templates ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
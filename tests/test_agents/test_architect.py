@@ -0,0 +1,47 @@
+"""
+Tests for the architect agent's use of the response cache.
+"""
+
+import os
+import tempfile
+import unittest
+
+from code_agent.agents.architect import ArchitectAgent
+from code_agent.utils.response_cache import ResponseCache
+
+class TestArchitectCaching(unittest.TestCase):
+    """Test cases for which ArchitectAgent runs the response cache may answer"""
+
+    def setUp(self):
+        """Set up an architect that counts model runs, with a temporary cache"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.temp_dir.name, "responses.sqlite3"), semantic=False)
+
+        self.prompts = []
+        self.architect = ArchitectAgent.__new__(ArchitectAgent)
+        self.architect.cache = self.cache
+        self.architect.template_cache = None
+        self.architect._cache_namespace = "architect:test_model"
+        self.architect._run_uncached = lambda prompt: self.prompts.append(prompt) or {"features": []}
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_analysis_is_cached(self):
+        """Test that a repeated analysis is answered from the cache"""
+        self.architect.analyze_requirements("A todo list")
+        self.architect.analyze_requirements("A todo list")
+        self.assertEqual(len(self.prompts), 1)
+
+    def test_structure_design_is_not_cached(self):
+        """Test that designing the structure, which writes files, always runs"""
+        features = [{"name": "todo", "description": "Todos", "priority": "high", "complexity": "low"}]
+        self.architect.design_project_structure("A todo list", features)
+        self.architect.design_project_structure("A todo list", features)
+        self.assertEqual(len(self.prompts), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
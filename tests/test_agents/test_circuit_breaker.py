@@ -0,0 +1,47 @@
+"""
+Tests for the agent circuit breaker.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from code_agent.agents.base import CircuitBreaker
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for the CircuitBreaker class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.breaker = CircuitBreaker(failure_threshold=3, cooldown=30.0)
+
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the breaker"""
+        for _ in range(2):
+            self.breaker.record_failure()
+            self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow())
+
+    def test_success_resets(self):
+        """Test that a success clears earlier failures"""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+
+    def test_half_open_after_cooldown(self):
+        """Test that calls go through after the cooldown and one failure reopens it"""
+        with patch("code_agent.agents.base.time.monotonic", return_value=100.0):
+            for _ in range(3):
+                self.breaker.record_failure()
+
+        with patch("code_agent.agents.base.time.monotonic", return_value=131.0):
+            self.assertTrue(self.breaker.allow())
+            self.breaker.record_failure()
+            self.assertFalse(self.breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+"""
+Tests for rendering prompt data as compact JSON.
+"""
+
+import unittest
+
+from code_agent.agents.base import compact_json
+
+class TestCompactJson(unittest.TestCase):
+    """Test cases for compact_json"""
+
+    def test_drops_empty_fields(self):
+        """Test that None and empty strings or containers are left out"""
+        self.assertEqual(compact_json({"a": None, "b": "", "c": [], "d": {}, "e": "x"}), '{"e":"x"}')
+
+    def test_keeps_zero_and_false(self):
+        """Test that falsy values with meaning are kept"""
+        self.assertEqual(
+            compact_json({"failed": 0, "passed": True, "skipped": False, "rate": 0.0}),
+            '{"failed":0,"passed":true,"rate":0.0,"skipped":false}'
+        )
+
+    def test_strings_pass_through(self):
+        """Test that strings are returned unchanged"""
+        self.assertEqual(compact_json("already text"), "already text")
+
+
+if __name__ == "__main__":
+    unittest.main()
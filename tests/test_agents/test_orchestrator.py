@@ -0,0 +1,100 @@
+"""
+Tests for the agent orchestrator's run paths.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from collections import OrderedDict, defaultdict
+from types import SimpleNamespace
+
+from code_agent.agents.base import CircuitBreaker
+from code_agent.agents.orchestrator import _TASK_MAX_STEPS, AgentOrchestrator
+from code_agent.utils.response_cache import ResponseCache
+
+class FakeAgent:
+    """Agent that records its runs instead of calling a model"""
+
+    max_steps = 20
+
+    def __init__(self):
+        self.calls = []
+
+    def run(self, prompt, max_steps=None, stream=False):
+        self.calls.append((prompt, max_steps))
+        return "done"
+
+class SlowAgent(FakeAgent):
+    """Agent whose runs outlast the orchestrator's timeout"""
+
+    def run(self, prompt, max_steps=None, stream=False):
+        time.sleep(0.2)
+        return super().run(prompt, max_steps, stream)
+
+class TestOrchestratorRuns(unittest.TestCase):
+    """Test cases for AgentOrchestrator's synchronous runs"""
+
+    def setUp(self):
+        """Set up an orchestrator with a fake manager agent"""
+        self.manager = FakeAgent()
+        self.orchestrator = AgentOrchestrator.__new__(AgentOrchestrator)
+        self.orchestrator.config = SimpleNamespace(enable_prompt_cache=True, agent_timeout=5)
+        self.orchestrator.agents = {"manager": self.manager}
+        self.orchestrator._run_cache = OrderedDict()
+        self.orchestrator._run_cache_lock = threading.Lock()
+        self.orchestrator._breakers = defaultdict(CircuitBreaker)
+
+    def test_run_manager_uses_step_budget(self):
+        """Test that a non-streaming manager run gets its step budget"""
+        self.assertEqual(self.orchestrator.run_manager("build it"), "done")
+        self.assertEqual(self.manager.calls, [("build it", _TASK_MAX_STEPS["run_manager"])])
+
+    def test_only_read_only_runs_are_cached(self):
+        """Test that repeated architect runs are cached but runs that write files happen again"""
+        self.orchestrator.agents["architect"] = architect = FakeAgent()
+
+        for _ in range(2):
+            self.orchestrator._run_sync("architect", "plan it")
+            self.orchestrator._run_sync("manager", "build it")
+
+        self.assertEqual(len(architect.calls), 1)
+        self.assertEqual(len(self.manager.calls), 2)
+
+    def test_run_sync_times_out_and_opens_breaker(self):
+        """Test that synchronous runs honour agent_timeout and the circuit breaker"""
+        self.orchestrator.agents["manager"] = SlowAgent()
+        self.orchestrator.config.agent_timeout = 0.05
+        self.orchestrator._breakers["manager"] = CircuitBreaker(failure_threshold=1, cooldown=60.0)
+
+        with self.assertRaisesRegex(TimeoutError, "did not finish"):
+            self.orchestrator.run_manager("build it")
+        with self.assertRaisesRegex(TimeoutError, "cools down"):
+            self.orchestrator.run_manager("build it")
+
+    def test_analysis_is_memoized_in_response_cache(self):
+        """Test that an analysis is reused from the response cache when enabled"""
+        self.orchestrator.config = SimpleNamespace(
+            enable_prompt_cache=False, enable_response_cache=True, agent_timeout=5,
+            agents={"architect": SimpleNamespace(model_id="test_model")}
+        )
+        self.orchestrator.agents["architect"] = architect = FakeAgent()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.orchestrator.project_path = temp_dir
+            self.orchestrator._response_cache = ResponseCache(
+                os.path.join(temp_dir, "responses.sqlite3"), semantic=False
+            )
+            try:
+                first = self.orchestrator.analyze_requirements("A todo list")
+                second = self.orchestrator.analyze_requirements("A todo list")
+            finally:
+                self.orchestrator._response_cache.close()
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(architect.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Tests for the reviewer agent's prompts.
+"""
+
+import unittest
+
+from code_agent.agents.base import bulletize
+from code_agent.agents.reviewer import ReviewerAgent
+
+class TestReviewerPrompts(unittest.TestCase):
+    """Test cases for the prompts ReviewerAgent builds"""
+
+    def setUp(self):
+        """Set up a reviewer that returns its prompt instead of running a model"""
+        self.reviewer = ReviewerAgent.__new__(ReviewerAgent)
+        self.reviewer.run = lambda prompt: prompt
+
+    def test_review_code_accepts_file_dicts(self):
+        """Test that files given as {"path": ...} dicts are listed by path"""
+        prompt = self.reviewer.review_code(
+            {"name": "login", "description": "User login"},
+            [{"path": "app/auth.py"}, "app/models.py"],
+            {"passed": 3}
+        )
+
+        self.assertIn("- app/auth.py", prompt)
+        self.assertIn("- app/models.py", prompt)
+
+    def test_preformatted_files_are_used_as_given(self):
+        """Test that every file-listing method takes a preformatted list instead of its own"""
+        files_str = bulletize(["app/auth.py", "app/models.py"])
+        feature = {"name": "login", "description": "User login"}
+
+        prompts = [
+            self.reviewer.review_code(feature, [], {"passed": 3}, files_str=files_str),
+            self.reviewer.generate_documentation(feature, [], files_str=files_str),
+            self.reviewer.check_security_issues([], files_str=files_str),
+            self.reviewer.generate_api_documentation([], files_str=files_str),
+        ]
+        for prompt in prompts:
+            self.assertIn(files_str, prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+"""
+Tests for the tester agent's prompts.
+"""
+
+import unittest
+
+from code_agent.agents import tester
+
+class TestTesterPrompts(unittest.TestCase):
+    """Test cases for the prompts TesterAgent builds"""
+
+    def setUp(self):
+        """Set up a tester that records its prompts instead of running a model"""
+        self.prompts = []
+        self.tester = tester.TesterAgent.__new__(tester.TesterAgent)
+        self.tester.run = lambda prompt: self.prompts.append(prompt) or '{"login": {"status": "ok"}}'
+
+    def test_create_tests_batch_accepts_path_strings(self):
+        """Test that files may be plain paths as well as {"path": ...} dicts"""
+        results = self.tester.create_tests_batch({
+            "login": {"files": ["app/auth.py", {"path": "app/models.py"}]}
+        })
+
+        self.assertEqual(results, {"login": {"status": "ok"}})
+        self.assertIn("- login: app/auth.py, app/models.py", self.prompts[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
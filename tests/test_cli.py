@@ -0,0 +1,40 @@
+"""
+Tests for the command line interface.
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+class TestReadStdin(unittest.TestCase):
+    """Test cases for read_stdin"""
+
+    def run_script(self, script: str, stdin: str) -> str:
+        """Run a script in a fresh interpreter with piped standard input"""
+        result = subprocess.run(
+            [sys.executable, "-c", script], input=stdin, capture_output=True, text=True, cwd=ROOT, check=True
+        )
+        return result.stdout
+
+    def test_reads_piped_input(self):
+        """Test that all piped text is returned, stripped"""
+        output = self.run_script(
+            "from code_agent.cli import read_stdin; print(repr(read_stdin()))",
+            "req1\nreq2\n"
+        )
+        self.assertEqual(output.strip(), repr("req1\nreq2"))
+
+    def test_reads_after_input(self):
+        """Test that lines already buffered by input() are not lost"""
+        output = self.run_script(
+            "from code_agent.cli import read_stdin; input(); input(); print(repr(read_stdin()))",
+            "proj\ndesc\nreq1\nreq2\n"
+        )
+        self.assertEqual(output.strip(), repr("req1\nreq2"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -28,7 +28,7 @@ class TestConfig(unittest.TestCase):
     def tearDown(self):
         """Tear down test fixtures"""
         # Remove environment variables
-        for var in ["GITHUB_TOKEN", "GITHUB_USERNAME", "GITHUB_REPOSITORY"]:
+        for var in ["GITHUB_TOKEN", "GITHUB_USERNAME", "GITHUB_REPOSITORY", "MAX_PARALLEL_FEATURES", "AGENT_TIMEOUT", "ENABLE_RESPONSE_CACHE", "ENABLE_PROMPT_CACHE"]:
             if var in os.environ:
                 del os.environ[var]
         
@@ -81,6 +81,77 @@ class TestConfig(unittest.TestCase):
         # Invalid configuration
         self.config.github.token = ""
         self.assertFalse(self.config.validate())
+    
+    def test_max_parallel_features(self):
+        """Test the feature concurrency setting from environment and file"""
+        self.assertEqual(self.config.max_parallel_features, 4)
+        
+        # Saved value is loaded back
+        self.config.max_parallel_features = 2
+        self.config.save()
+        self.assertEqual(Config(self.config_path).max_parallel_features, 2)
+        
+        # Environment variable takes precedence
+        os.environ["MAX_PARALLEL_FEATURES"] = "8"
+        self.assertEqual(Config(self.config_path).max_parallel_features, 8)
+    
+    def test_agent_timeout(self):
+        """Test the agent timeout from environment and file, and invalid values"""
+        self.assertEqual(self.config.agent_timeout, 300)
+        
+        # Saved value is loaded back
+        self.config.agent_timeout = 60
+        self.config.save()
+        self.assertEqual(Config(self.config_path).agent_timeout, 60)
+        
+        # Environment variable takes precedence
+        os.environ["AGENT_TIMEOUT"] = "12.5"
+        self.assertEqual(Config(self.config_path).agent_timeout, 12.5)
+        
+        # Values that aren't positive numbers fall back to the default
+        for value in ("soon", "0", "-5"):
+            os.environ["AGENT_TIMEOUT"] = value
+            self.assertEqual(Config(self.config_path).agent_timeout, 300)
+    
+    def test_agent_endpoints(self):
+        """Test that an agent's endpoint list is saved and loaded back"""
+        self.assertEqual(self.config.agents["developer"].endpoints, [])
+        
+        endpoints = ["https://a.example/v1", "https://b.example/v1"]
+        self.config.agents["developer"].endpoints = endpoints
+        self.config.save()
+        self.assertEqual(Config(self.config_path).agents["developer"].endpoints, endpoints)
+    
+    def test_agent_settings(self):
+        """Test that an agent's step budget and verbosity are saved and loaded back"""
+        self.config.agents["tester"].max_steps = 7
+        self.config.agents["tester"].verbosity_level = 2
+        self.config.save()
+        
+        loaded = Config(self.config_path).agents["tester"]
+        self.assertEqual(loaded.max_steps, 7)
+        self.assertEqual(loaded.verbosity_level, 2)
+        self.assertEqual(loaded.temperature, AgentConfig("tester", "m").temperature)
+    
+    def test_enable_response_cache(self):
+        """Test the response cache switch from environment and file"""
+        self.assertFalse(self.config.enable_response_cache)
+        
+        # Saved value is loaded back
+        self.config.enable_response_cache = True
+        self.config.save()
+        self.assertTrue(Config(self.config_path).enable_response_cache)
+        
+        # Environment variable takes precedence
+        os.environ["ENABLE_RESPONSE_CACHE"] = "0"
+        self.assertFalse(Config(self.config_path).enable_response_cache)
+    
+    def test_enable_prompt_cache(self):
+        """Test the in-process prompt cache switch, on by default"""
+        self.assertTrue(self.config.enable_prompt_cache)
+        
+        os.environ["ENABLE_PROMPT_CACHE"] = "false"
+        self.assertFalse(Config(self.config_path).enable_prompt_cache)
 
 
 if __name__ == "__main__":
@@ -69,10 +69,11 @@ class TestAgentIntegration(unittest.TestCase):
         self.assertIn("manager", orchestrator.agents)
         
         # Verify tool initialization
-        self.assertIn("filesystem", orchestrator.tools)
-        self.assertIn("code", orchestrator.tools)
-        self.assertIn("test", orchestrator.tools)
-        self.assertIn("github", orchestrator.tools)
+        self.assertIsNotNone(orchestrator.tools.filesystem)
+        self.assertIsNotNone(orchestrator.tools.code)
+        self.assertIsNotNone(orchestrator.tools.test)
+        # The GitHub set is None when its client fails to initialize
+        self.assertTrue(hasattr(orchestrator.tools, "github"))
     
     @patch('smolagents.HfApiModel')
     @patch('smolagents.CodeAgent')
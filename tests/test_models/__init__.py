@@ -0,0 +1,3 @@
+"""
+Tests for model management.
+"""
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Tests for the multi-endpoint model.
+"""
+
+import unittest
+from types import SimpleNamespace
+
+from code_agent.models.model_manager import HTTP_RETRY_STATUSES
+from code_agent.models.multi_endpoint import MultiEndpointModel
+
+class RateLimitError(Exception):
+    """Error shaped like an HTTP error raised for a 429 response"""
+    
+    def __init__(self):
+        super().__init__("429 Too Many Requests")
+        self.response = SimpleNamespace(status_code=429)
+
+class FakeModel:
+    """Endpoint stand-in that records calls and optionally raises"""
+    
+    def __init__(self, model_id, error=None):
+        self.model_id = model_id
+        self.error = error
+        self.calls = 0
+    
+    def __call__(self, messages):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return f"{self.model_id}: {messages}"
+
+class TestMultiEndpointModel(unittest.TestCase):
+    """Test cases for the MultiEndpointModel class"""
+    
+    def test_rate_limited_endpoint_fails_over(self):
+        """Test that a 429 moves the call to the next endpoint"""
+        limited = FakeModel("a", RateLimitError())
+        healthy = FakeModel("b")
+        model = MultiEndpointModel([limited, healthy])
+        
+        self.assertEqual(model("hi"), "b: hi")
+        self.assertEqual(limited.calls, 1)
+        self.assertEqual(healthy.calls, 1)
+    
+    def test_other_errors_are_raised(self):
+        """Test that errors other than rate limiting don't fail over"""
+        broken = FakeModel("a", RuntimeError("boom"))
+        healthy = FakeModel("b")
+        model = MultiEndpointModel([broken, healthy])
+        
+        with self.assertRaises(RuntimeError):
+            model("hi")
+        self.assertEqual(healthy.calls, 0)
+    
+    def test_all_endpoints_rate_limited(self):
+        """Test that the last rate limit error is raised once every endpoint is tried"""
+        model = MultiEndpointModel([FakeModel("a", RateLimitError()), FakeModel("b", RateLimitError())])
+        
+        with self.assertRaises(RateLimitError):
+            model("hi")
+    
+    def test_pooled_session_leaves_rate_limits_to_failover(self):
+        """Test that the shared HTTP session doesn't retry 429s itself"""
+        self.assertNotIn(429, HTTP_RETRY_STATUSES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests for the agent response cache.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from code_agent.utils.response_cache import ResponseCache, get_default_cache
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the ResponseCache class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.temp_dir.name, "responses.sqlite3")
+        self.cache = ResponseCache(self.cache_path, semantic=False)
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_exact_hit(self):
+        """Test that an identical prompt returns the stored response"""
+        self.cache.put("architect", "design a todo app", {"features": ["tasks"]})
+        self.assertEqual(self.cache.get("architect", "design a todo app"), {"features": ["tasks"]})
+        self.assertIsNone(self.cache.get("architect", "design a chat app"))
+
+    def test_namespaces_do_not_collide(self):
+        """Test that agents with the same prompt keep separate entries"""
+        self.cache.put("architect", "prompt", "architect answer")
+        self.assertIsNone(self.cache.get("developer", "prompt"))
+
+    def test_persists_across_instances(self):
+        """Test that entries survive reopening the database"""
+        self.cache.put("tester", "prompt", "answer")
+        self.cache.close()
+
+        self.cache = ResponseCache(self.cache_path, semantic=False)
+        self.assertEqual(self.cache.get("tester", "prompt"), "answer")
+
+    def test_access_times_written_on_close(self):
+        """Test that batched access-time updates from hits reach the database"""
+        self.cache.put("tester", "prompt", "answer")
+        key = ResponseCache.make_key("tester", "prompt")
+        with patch("code_agent.utils.response_cache.time.time", return_value=time.time() + 60):
+            self.cache.get("tester", "prompt")
+        self.cache.close()
+
+        self.cache = ResponseCache(self.cache_path, semantic=False)
+        created_at, accessed_at = self.cache._conn.execute(
+            "SELECT created_at, accessed_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        self.assertGreater(accessed_at, created_at)
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are treated as misses"""
+        self.cache.ttl = 0.01
+        self.cache.put("reviewer", "prompt", "answer")
+        time.sleep(0.05)
+        self.assertIsNone(self.cache.get("reviewer", "prompt"))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        self.cache.max_entries = 2
+        self.cache.put("developer", "first", 1)
+        self.cache.put("developer", "second", 2)
+        self.cache.get("developer", "first")
+        self.cache.put("developer", "third", 3)
+
+        self.assertEqual(self.cache.get("developer", "first"), 1)
+        self.assertIsNone(self.cache.get("developer", "second"))
+        self.assertEqual(self.cache.get("developer", "third"), 3)
+
+    def test_unserializable_response_is_skipped(self):
+        """Test that responses which can't be stored as JSON are not cached"""
+        self.cache.put("developer", "prompt", object())
+        self.assertIsNone(self.cache.get("developer", "prompt"))
+
+    def test_default_cache_is_gated_by_env(self):
+        """Test that the default cache only exists when CODE_AGENT_CACHE is set"""
+        get_default_cache.cache_clear()
+        self.addCleanup(get_default_cache.cache_clear)
+        with patch.dict(os.environ, {"CODE_AGENT_CACHE": ""}):
+            self.assertIsNone(get_default_cache())
+
+        get_default_cache.cache_clear()
+        default_path = os.path.join(self.temp_dir.name, "default.sqlite3")
+        with patch.dict(os.environ, {"CODE_AGENT_CACHE": "1"}), \
+                patch("code_agent.utils.response_cache.DEFAULT_CACHE_PATH", default_path):
+            cache = get_default_cache()
+        self.addCleanup(cache.close)
+        self.assertFalse(cache.semantic)
+        self.assertIs(get_default_cache(), cache)
+
+    def test_default_cache_semantic_mode(self):
+        """Test that CODE_AGENT_CACHE=semantic enables the embedding tier"""
+        get_default_cache.cache_clear()
+        self.addCleanup(get_default_cache.cache_clear)
+        default_path = os.path.join(self.temp_dir.name, "default.sqlite3")
+        with patch.dict(os.environ, {"CODE_AGENT_CACHE": "semantic"}), \
+                patch("code_agent.utils.response_cache.DEFAULT_CACHE_PATH", default_path):
+            cache = get_default_cache()
+        self.addCleanup(cache.close)
+        self.assertTrue(cache.semantic)
+
+
+if __name__ == "__main__":
+    unittest.main()
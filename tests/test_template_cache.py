@@ -0,0 +1,80 @@
+"""
+Tests for the requirements template cache.
+"""
+
+import os
+import tempfile
+import unittest
+
+from code_agent.utils.template_cache import TemplateCache, extract_slots, fingerprint
+
+class TestTemplateCache(unittest.TestCase):
+    """Test cases for the TemplateCache class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = TemplateCache(os.path.join(self.temp_dir.name, "templates.sqlite3"))
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_fingerprint_ignores_interchangeable_values(self):
+        """Test that projects of the same shape share a fingerprint"""
+        self.assertEqual(
+            fingerprint("A Python REST API with FastAPI and PostgreSQL"),
+            fingerprint("A Python REST API with Flask and MySQL")
+        )
+        self.assertNotEqual(
+            fingerprint("A Python REST API with FastAPI and PostgreSQL"),
+            fingerprint("A Python REST API with FastAPI and MongoDB")
+        )
+
+    def test_ambiguous_slots_are_not_fingerprinted(self):
+        """Test that requirements naming two frameworks are not cached"""
+        self.assertIsNone(extract_slots("Use Flask or Django"))
+        self.assertIsNone(fingerprint("Use Flask or Django"))
+        self.assertIsNone(fingerprint("Something with no known technology"))
+
+    def test_fingerprint_depends_on_requirements(self):
+        """Test that projects on the same stack but with different requirements don't share a plan"""
+        self.assertNotEqual(
+            fingerprint("A Python REST API with FastAPI and PostgreSQL for a todo list"),
+            fingerprint("A Python REST API with FastAPI and PostgreSQL for an online shop")
+        )
+
+    def test_template_is_instantiated_with_new_slots(self):
+        """Test that a hit fills in the new request's slot values"""
+        self.cache.put(
+            "A Python API with FastAPI and PostgreSQL",
+            {"framework": "FastAPI", "database": "PostgreSQL", "dependencies": ["fastapi", "sqlalchemy"]}
+        )
+
+        plan = self.cache.get("A Python API with Flask and MySQL")
+        self.assertEqual(plan, {"framework": "Flask", "database": "MySQL", "dependencies": ["Flask", "sqlalchemy"]})
+
+    def test_only_whole_values_are_substituted(self):
+        """Test that slot values inside longer strings are left alone"""
+        self.cache.put("A Python CLI using SQLite", {"dependencies": ["python-dotenv", "Python"]})
+
+        plan = self.cache.get("A Python CLI using SQLite")
+        self.assertEqual(plan, {"dependencies": ["python-dotenv", "Python"]})
+
+    def test_invalid_template_is_evicted(self):
+        """Test that a template leaving another slot value behind is dropped"""
+        self.cache.put("A Python API with FastAPI", {"notes": "FastAPI and Starlette; see flask docs"})
+
+        self.assertIsNone(self.cache.get("A Python API with Django"))
+        self.assertIsNone(self.cache.get("A Python API with FastAPI"))
+
+    def test_invalidate(self):
+        """Test that invalidate removes the template for a shape"""
+        self.cache.put("A Python CLI using SQLite", "plan for SQLite")
+        self.cache.invalidate("A Python CLI using SQLite")
+        self.assertIsNone(self.cache.get("A Python CLI using SQLite"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Tests for the test running tools.
+"""
+
+import os
+import tempfile
+import unittest
+
+from code_agent.tools import test_tools
+
+PASSING = "def test_ok():\n    assert True\n"
+FAILING = "def test_ok():\n    assert True\n\ndef test_bad():\n    assert False\n"
+ERRORING = "import module_that_does_not_exist\n\ndef test_never_runs():\n    pass\n"
+
+class TestRunTestsBatch(unittest.TestCase):
+    """Test cases for run_tests_batch"""
+
+    def setUp(self):
+        """Set up a project with passing, failing and erroring test files"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.previous_path = test_tools._project_path
+        test_tools.set_project_path(self.temp_dir.name)
+
+        os.makedirs(os.path.join(self.temp_dir.name, "tests"))
+        for name, source in (("test_pass.py", PASSING), ("test_fail.py", FAILING), ("test_error.py", ERRORING)):
+            with open(os.path.join(self.temp_dir.name, "tests", name), "w") as f:
+                f.write(source)
+
+    def tearDown(self):
+        """Tear down test fixtures"""
+        test_tools._project_path = self.previous_path
+        self.temp_dir.cleanup()
+
+    def test_results_per_path(self):
+        """Test that each file gets its own counts and status"""
+        result = test_tools.run_tests_batch(["tests/test_pass.py", "tests/test_fail.py"])
+
+        self.assertEqual(result["status"], "failure")
+        self.assertEqual(result["per_path"]["tests/test_pass.py"]["status"], "success")
+        self.assertEqual(result["per_path"]["tests/test_pass.py"]["summary"]["passed"], 1)
+        self.assertEqual(result["per_path"]["tests/test_fail.py"]["status"], "failure")
+        self.assertEqual(result["per_path"]["tests/test_fail.py"]["summary"]["failed"], 1)
+        self.assertEqual(result["summary"], {"passed": 2, "failed": 1, "skipped": 0, "total": 3})
+
+    def test_collection_error_does_not_stop_other_files(self):
+        """Test that a file failing to import is reported without hiding the others' results"""
+        result = test_tools.run_tests_batch(["tests/test_pass.py", "tests/test_error.py"])
+
+        self.assertEqual(result["status"], "failure")
+        self.assertEqual(result["per_path"]["tests/test_pass.py"]["summary"]["passed"], 1)
+        self.assertEqual(result["per_path"]["tests/test_error.py"]["status"], "failure")
+        self.assertEqual(result["per_path"]["tests/test_error.py"]["summary"]["failed"], 1)
+
+    def test_directory(self):
+        """Test that a directory collects the results of every file in it"""
+        result = test_tools.run_tests_batch(["tests"])
+
+        self.assertEqual(result["per_path"]["tests"]["summary"], {"passed": 2, "failed": 2, "skipped": 0, "total": 4})
+
+    def test_missing_path(self):
+        """Test that missing paths are reported without running pytest"""
+        result = test_tools.run_tests_batch(["tests/test_missing.py"])
+
+        self.assertEqual(result["status"], "error")
+        self.assertIn("tests/test_missing.py", result["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()